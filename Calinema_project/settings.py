@@ -131,6 +131,55 @@ if not DEBUG:
     STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
     STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# Caché en disco de las páginas descargadas por los scrapers (vacío para desactivarla)
+
+SCRAPING_HTTP_CACHE_DIR = os.environ.get('SCRAPING_HTTP_CACHE_DIR', default=os.path.join(BASE_DIR, 'http_cache'))
+SCRAPING_HTTP_CACHE_MAX_SIZE_MB = int(os.environ.get('SCRAPING_HTTP_CACHE_MAX_SIZE_MB', default=100))
+
+# Días que se reutilizan los datos de detalle de una película antes de volver a scrapearlos
+
+SCRAPING_METADATA_TTL_DAYS = int(os.environ.get('SCRAPING_METADATA_TTL_DAYS', default=7))
+
+# Navegadores de Selenium abiertos a la vez por proceso; debe superar los scrapers en paralelo (--workers)
+
+SCRAPING_MAX_BROWSERS = int(os.environ.get('SCRAPING_MAX_BROWSERS', default=8))
+
+# API a la que los comandos de scraping envían los datos con --sink http
+
+CALINEMA_API_URL = os.environ.get('CALINEMA_API_URL', default='https://api-calinema.onrender.com/api/')
+
+# Caché de respuestas de la API de lectura. Por defecto en memoria de cada proceso;
+# con CACHE_DIR se comparte en disco entre procesos (varios workers). La versión que
+# las invalida vive en la base de datos, así que la ve cualquier proceso que guarde datos
+
+CACHE_DIR = os.environ.get('CACHE_DIR')
+
+if CACHE_DIR:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_DIR,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Segundos que se guarda una respuesta; una ingesta con cambios la invalida antes
+
+RESPONSE_CACHE_TIMEOUT = int(os.environ.get('RESPONSE_CACHE_TIMEOUT', default=3600))
+
+# Horas (en TIME_ZONE) en que se programa el scraping y cuánto tarda: los clientes pueden
+# reutilizar las respuestas (Cache-Control max-age) hasta que haya datos nuevos
+
+SCRAPE_SCHEDULE_HOURS = [
+    int(hour) for hour in os.environ.get('SCRAPE_SCHEDULE_HOURS', default='11').split(',')
+]
+SCRAPE_DURATION_MINUTES = int(os.environ.get('SCRAPE_DURATION_MINUTES', default=60))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -1,17 +1,26 @@
 from .models import Movie, CinemaShowtime
 from rest_framework import viewsets, permissions
 from .serializers import MovieSerializer, CinemaShowtimeSerializer
+from .pagination import MoviePagination, CinemaShowtimePagination
+from .filters import QueryParamsFilterBackend, MovieFilter, CinemaShowtimeFilter
+from .cache import CachedReadMixin
 
-class MovieViewSet(viewsets.ModelViewSet):
+class MovieViewSet(CachedReadMixin, viewsets.ModelViewSet):
     queryset = Movie.objects.all()
     permission_classes = [
         permissions.AllowAny
     ]
     serializer_class = MovieSerializer
+    pagination_class = MoviePagination
+    filter_backends = [QueryParamsFilterBackend]
+    filter_class = MovieFilter
 
-class CinemaShowtimeViewSet(viewsets.ModelViewSet):
+class CinemaShowtimeViewSet(CachedReadMixin, viewsets.ModelViewSet):
     queryset = CinemaShowtime.objects.all()
     permission_classes = [
         permissions.AllowAny
     ]
-    serializer_class = CinemaShowtimeSerializer
\ No newline at end of file
+    serializer_class = CinemaShowtimeSerializer
+    pagination_class = CinemaShowtimePagination
+    filter_backends = [QueryParamsFilterBackend]
+    filter_class = CinemaShowtimeFilter
\ No newline at end of file
@@ -0,0 +1,210 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+from typing import Callable
+from .models import DataVersion
+import datetime
+import hashlib
+import time
+
+
+# La versión de los datos es la única fila de DataVersion: se comparte entre procesos
+DATA_VERSION_ID = 1
+
+# Tiempo máximo que una petición espera a que otra termine de construir la misma respuesta
+REBUILD_WAIT_SECONDS = 10
+REBUILD_POLL_SECONDS = 0.05
+
+
+def get_data_version() -> dict:
+    """{"version", "changed_at"} de los datos actuales, con una consulta por clave primaria"""
+    # Si la fila no existe todavía, changed_at es ahora: nunca anterior al último cambio real
+    data_version, _ = DataVersion.objects.get_or_create(id=DATA_VERSION_ID)
+    changed_at = int(data_version.changed_at.timestamp())
+
+    # changed_at distingue la versión 3 de una base recreada de la versión 3 anterior
+    return {"version": f"{data_version.version}-{changed_at}", "changed_at": changed_at}
+
+
+def bump_data_version() -> None:
+    """
+    Invalida todas las respuestas en caché cambiando la versión de los datos.
+    Dentro de una transacción se confirma junto con los cambios que la causan.
+    """
+    DataVersion.objects.get_or_create(id=DATA_VERSION_ID)
+    DataVersion.objects.filter(id=DATA_VERSION_ID).update(
+        version=F("version") + 1, changed_at=timezone.now()
+    )
+
+
+def get_seconds_until_next_scrape(now: datetime.datetime | None = None) -> int:
+    """
+    Segundos hasta que deberían estar listos los datos del próximo scraping
+    programado (SCRAPE_SCHEDULE_HOURS + SCRAPE_DURATION_MINUTES). Es el tiempo
+    que un cliente puede reutilizar una respuesta sin volver a preguntar.
+    """
+    now = now or timezone.localtime()
+    duration = datetime.timedelta(minutes=settings.SCRAPE_DURATION_MINUTES)
+    ready_times = [
+        datetime.datetime.combine(now.date() + datetime.timedelta(days=days), datetime.time(hour), now.tzinfo)
+        + duration
+        for days in (-1, 0, 1)
+        for hour in settings.SCRAPE_SCHEDULE_HOURS
+    ]
+    next_ready = min(ready_time for ready_time in ready_times if ready_time > now)
+
+    return int((next_ready - now).total_seconds())
+
+
+def get_validators(data_version: dict, default_date: datetime.date | None = None) -> tuple[str, int]:
+    """
+    ETag y Last-Modified (timestamp) de una respuesta. Con `default_date` la
+    respuesta también cambia cuando cambia el día, aunque los datos sigan iguales.
+    """
+    # Débil: el mismo contenido puede renderizarse como JSON o como la API navegable
+    if default_date is None:
+        return f'W/"{data_version["version"]}"', data_version["changed_at"]
+
+    day_start = datetime.datetime.combine(default_date, datetime.time(), timezone.get_current_timezone())
+
+    return (
+        f'W/"{data_version["version"]}:{default_date.isoformat()}"',
+        max(data_version["changed_at"], int(day_start.timestamp())),
+    )
+
+
+def get_max_age(default_date: datetime.date | None = None) -> int:
+    max_age = get_seconds_until_next_scrape()
+
+    if default_date is not None:
+        # La respuesta de "hoy" vence a medianoche aunque no haya scraping antes
+        now = timezone.localtime()
+        midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time(), now.tzinfo)
+        max_age = min(max_age, int((midnight - now).total_seconds()))
+
+    return max_age
+
+
+def add_validators(response, etag: str, last_modified: int, max_age: int) -> None:
+    response["ETag"] = etag
+
+    # Last-Modified tiene resolución de segundos: si los datos cambiaron en este mismo
+    # segundo, otro cambio antes de que termine tendría la misma fecha y daría un 304 falso
+    if int(time.time()) > last_modified:
+        response["Last-Modified"] = http_date(last_modified)
+
+    patch_cache_control(response, public=True, max_age=max_age)
+    # JSON y la API navegable comparten ETag: que los caches intermedios las separen
+    patch_vary_headers(response, ["Accept"])
+
+
+def get_response_cache_key(request, version: str, default_date: datetime.date | None = None) -> str:
+    query = sorted(request.query_params.lists())
+    # La fecha que la vista usa cuando la query no la trae: sin ella se serviría la cartelera de ayer
+    path = hashlib.sha256(f"{request.path}?{query}&{default_date}".encode("utf-8")).hexdigest()
+
+    return f"calinema:response:{version}:{path}"
+
+
+def get_cached_response(
+    request, build_response: Callable[[], Response], default_date: datetime.date | None = None
+) -> Response:
+    """
+    Devuelve la respuesta guardada para esta ruta, query y versión de datos, o
+    la construye con `build_response`. `default_date` es la fecha que la vista
+    resolvió por su cuenta (p. ej. hoy cuando no llega ?date=). Si el cliente ya tiene la versión actual
+    (If-None-Match / If-Modified-Since) responde 304 con una sola consulta, la de
+    la versión compartida, sin construir ni serializar la respuesta.
+    Si varias peticiones piden a la vez la misma respuesta que no está en caché,
+    solo una la construye: las demás esperan a que aparezca.
+    """
+    data_version = get_data_version()
+    etag, last_modified = get_validators(data_version, default_date)
+    max_age = get_max_age(default_date)
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    if not_modified is not None:
+        add_validators(not_modified, etag, last_modified, max_age)
+        return not_modified
+
+    response = get_or_build_response(request, data_version, build_response, default_date)
+
+    if response.status_code == 200:
+        add_validators(response, etag, last_modified, max_age)
+
+    return response
+
+
+def get_or_build_response(
+    request,
+    data_version: dict,
+    build_response: Callable[[], Response],
+    default_date: datetime.date | None = None,
+) -> Response:
+    key = get_response_cache_key(request, data_version["version"], default_date)
+    lock_key = f"{key}:lock"
+    deadline = time.monotonic() + REBUILD_WAIT_SECONDS
+
+    while True:
+        cached = cache.get(key)
+
+        if cached is not None:
+            return Response(cached)
+
+        if cache.add(lock_key, True, timeout=REBUILD_WAIT_SECONDS):
+            break
+
+        if time.monotonic() >= deadline:
+            # La petición que tenía el lock tardó demasiado o falló: construirla aquí
+            return build_response()
+
+        time.sleep(REBUILD_POLL_SECONDS)
+
+    try:
+        response = build_response()
+
+        # Solo se guardan respuestas correctas; los errores se recalculan
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout=settings.RESPONSE_CACHE_TIMEOUT)
+
+        return response
+
+    finally:
+        cache.delete(lock_key)
+
+
+class CachedReadMixin:
+    """
+    Sirve list y retrieve desde la caché de respuestas e invalida la caché
+    cuando la vista crea, modifica o borra un registro.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return get_cached_response(
+            request, lambda: super(CachedReadMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return get_cached_response(
+            request, lambda: super(CachedReadMixin, self).retrieve(request, *args, **kwargs)
+        )
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            super().perform_create(serializer)
+            bump_data_version()
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            super().perform_update(serializer)
+            bump_data_version()
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            super().perform_destroy(instance)
+            bump_data_version()
@@ -0,0 +1,118 @@
+from django.utils import timezone
+from rest_framework import serializers
+import datetime
+from rest_framework.filters import BaseFilterBackend
+
+
+class QueryParamsFilterBackend(BaseFilterBackend):
+    """
+    Filtra con los parámetros de la URL validados por el `filter_class` de la
+    vista. Un parámetro inválido o una combinación sin índice responde 400.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filter_class = getattr(view, "filter_class", None)
+
+        if filter_class is None:
+            return queryset
+
+        query_filter = filter_class(data=request.query_params)
+        query_filter.is_valid(raise_exception=True)
+
+        return query_filter.filter_queryset(queryset)
+
+
+class MovieFilter(serializers.Serializer):
+    cinema_name = serializers.CharField(required=False, max_length=100)
+    # Prefijo del título, sensible a mayúsculas para poder usar el índice
+    title = serializers.CharField(required=False, max_length=100)
+
+    def filter_queryset(self, queryset):
+        if "cinema_name" in self.validated_data:
+            queryset = queryset.filter(cinema_name=self.validated_data["cinema_name"])
+
+        if "title" in self.validated_data:
+            queryset = queryset.filter(title__startswith=self.validated_data["title"])
+
+        return queryset
+
+
+class CinemaShowtimeFilter(serializers.Serializer):
+    date = serializers.DateField(required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    movie = serializers.IntegerField(required=False, min_value=1)
+    cinema_name = serializers.CharField(required=False, max_length=100)
+    room = serializers.CharField(required=False, max_length=100)
+    # "format" lo reserva DRF para elegir el renderer (?format=json)
+    movie_format = serializers.CharField(required=False, max_length=100)
+    schedule_after = serializers.TimeField(required=False)
+    schedule_before = serializers.TimeField(required=False)
+
+    # Solo tienen índice dentro de un día, de un rango acotado de días o de una película
+    ANCHOR_FIELDS = ["date", "date_from", "movie"]
+    ANCHORED_FIELDS = ["cinema_name", "room", "movie_format", "schedule_after", "schedule_before"]
+    # Un rango más largo (o abierto) recorre casi toda la tabla
+    MAX_DATE_RANGE_DAYS = 31
+
+    def validate(self, attrs):
+        if "date" in attrs and ("date_from" in attrs or "date_to" in attrs):
+            raise serializers.ValidationError("Use date o date_from/date_to, no ambos")
+
+        if ("date_from" in attrs) != ("date_to" in attrs):
+            raise serializers.ValidationError("date_from y date_to deben enviarse juntos")
+
+        if "date_from" in attrs:
+            if attrs["date_from"] > attrs["date_to"]:
+                raise serializers.ValidationError("date_from no puede ser posterior a date_to")
+
+            if (attrs["date_to"] - attrs["date_from"]).days >= self.MAX_DATE_RANGE_DAYS:
+                raise serializers.ValidationError(
+                    f"El rango de fechas no puede superar {self.MAX_DATE_RANGE_DAYS} días"
+                )
+
+        anchored_fields = [field for field in self.ANCHORED_FIELDS if field in attrs]
+
+        if anchored_fields and not any(field in attrs for field in self.ANCHOR_FIELDS):
+            raise serializers.ValidationError(
+                f"{', '.join(anchored_fields)} requiere filtrar también por date, "
+                "date_from y date_to, o movie"
+            )
+
+        return attrs
+
+    def filter_queryset(self, queryset):
+        lookups = {
+            "date": "date",
+            "date_from": "date__gte",
+            "date_to": "date__lte",
+            "movie": "movie_id",
+            "cinema_name": "cinema_name",
+            "room": "room",
+            "movie_format": "format",
+            "schedule_after": "schedule__gte",
+            "schedule_before": "schedule__lte",
+        }
+
+        return queryset.filter(
+            **{
+                lookup: self.validated_data[field]
+                for field, lookup in lookups.items()
+                if field in self.validated_data
+            }
+        )
+
+
+class BillboardFilter(serializers.Serializer):
+    date = serializers.DateField(required=False)
+    cinema_name = serializers.CharField(required=False, max_length=100)
+
+    def get_showtimes(self, queryset, default_date: datetime.date | None = None):
+        queryset = queryset.filter(
+            date=self.validated_data.get("date", default_date or timezone.localdate())
+        )
+
+        if "cinema_name" in self.validated_data:
+            queryset = queryset.filter(cinema_name=self.validated_data["cinema_name"])
+
+        return queryset
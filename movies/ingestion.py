@@ -0,0 +1,593 @@
+from django.db import transaction
+from django.utils import timezone
+from itertools import islice
+from rest_framework.exceptions import ValidationError
+import hashlib
+import json
+from typing import Callable, Iterable
+from .cache import bump_data_version
+from .models import Movie, CinemaShowtime
+from .serializers import MovieIngestSerializer, CinemaShowtimeIngestSerializer
+
+
+# Filas que se validan y guardan juntas en una transacción
+INGEST_BATCH_SIZE = 500
+
+# Campos de contenido de una película (todo menos id y fechas)
+MOVIE_FIELDS = [
+    "title",
+    "duration",
+    "classification",
+    "cinema_name",
+    "genres",
+    "original_title",
+    "country_origin",
+    "director",
+    "actors",
+    "language",
+    "synopsis",
+    "image_url",
+]
+
+
+def get_content_hash(values: list) -> str:
+    return hashlib.sha256(json.dumps(values, default=str).encode("utf-8")).hexdigest()
+
+
+def get_movie_scope(movie_data: dict):
+    # Una sincronización reemplaza la cartelera completa de cada cine enviado
+    return movie_data.get("cinema_name")
+
+
+def get_movie_fields(movie_data: dict) -> dict:
+    # Los campos que no llegan toman su valor por defecto, igual que al crear la película
+    return {
+        field: movie_data[field] if field in movie_data else Movie._meta.get_field(field).get_default()
+        for field in MOVIE_FIELDS
+    }
+
+
+def upsert_movies(movies_data: list[dict], batch_size: int = INGEST_BATCH_SIZE) -> dict:
+    """
+    Inserta o actualiza películas por su clave natural (cinema_name, title) con
+    unas pocas consultas en lote. Solo se reescriben las películas cuyo hash de
+    contenido cambió, así updated_at no se mueve en las que siguen iguales.
+    """
+    # Si una película llega repetida se guarda su última aparición
+    rows = {(movie["cinema_name"], movie["title"]): movie for movie in movies_data}
+
+    existing_movies = {
+        (cinema_name, title): (movie_id, content_hash)
+        for movie_id, cinema_name, title, content_hash in Movie.objects.filter(
+            cinema_name__in={cinema_name for cinema_name, _ in rows},
+            title__in={title for _, title in rows},
+        ).values_list("id", "cinema_name", "title", "content_hash")
+    }
+
+    now = timezone.now()
+    movies_to_create = []
+    movies_to_update = []
+
+    for key, movie_data in rows.items():
+        fields = get_movie_fields(movie_data)
+        content_hash = get_content_hash([fields[field] for field in MOVIE_FIELDS])
+        movie_id, stored_hash = existing_movies.get(key, (None, None))
+
+        if movie_id is None:
+            movies_to_create.append(Movie(**fields, content_hash=content_hash))
+
+        elif stored_hash != content_hash:
+            # bulk_update no aplica auto_now
+            movies_to_update.append(
+                Movie(id=movie_id, **fields, content_hash=content_hash, updated_at=now)
+            )
+
+    with transaction.atomic():
+        Movie.objects.bulk_create(movies_to_create, batch_size=batch_size)
+        Movie.objects.bulk_update(
+            movies_to_update,
+            MOVIE_FIELDS + ["content_hash", "updated_at"],
+            batch_size=batch_size,
+        )
+
+        if movies_to_create or movies_to_update:
+            bump_data_version()
+
+    return {
+        "created": len(movies_to_create),
+        "updated": len(movies_to_update),
+        "unchanged": len(rows) - len(movies_to_create) - len(movies_to_update),
+        "changed_scopes": sorted(
+            {movie.cinema_name for movie in movies_to_create + movies_to_update}
+        ),
+    }
+
+
+def delete_missing_movies(seen_keys: set, scopes: set) -> dict:
+    """
+    Borra las películas de los cines en `scopes` que no están en `seen_keys`.
+    Las que tienen funciones se conservan: borrarlas se llevaría en cascada
+    todas sus funciones, también las de días anteriores.
+    """
+    deleted_ids = []
+    changed_scopes = set()
+
+    for movie_id, cinema_name, title in Movie.objects.filter(
+        cinema_name__in=scopes, cinemashowtime__isnull=True
+    ).values_list("id", "cinema_name", "title"):
+        if (cinema_name, title) not in seen_keys:
+            deleted_ids.append(movie_id)
+            changed_scopes.add(cinema_name)
+
+    # Se vuelve a filtrar al borrar por si otra petición le agregó funciones mientras tanto
+    deleted = delete_in_batches(Movie.objects.filter(cinemashowtime__isnull=True), deleted_ids)
+
+    return {"deleted": deleted, "changed_scopes": sorted(changed_scopes)}
+
+
+def delete_in_batches(queryset, ids: list[int], batch_size: int = INGEST_BATCH_SIZE) -> int:
+    """Borra las filas de `queryset` con id en `ids` y devuelve cuántas se borraron"""
+    if not ids:
+        return 0
+
+    deleted = 0
+
+    with transaction.atomic():
+        for start in range(0, len(ids), batch_size):
+            _, deleted_by_model = queryset.filter(id__in=ids[start:start + batch_size]).delete()
+            deleted += deleted_by_model.get(queryset.model._meta.label, 0)
+
+        if deleted:
+            bump_data_version()
+
+    return deleted
+
+
+# Clave natural de una función, igual a la restricción unique_showtime
+SHOWTIME_KEY_FIELDS = ["movie_id", "cinema_name", "room", "format", "date", "schedule"]
+
+ON_CONFLICT_CHOICES = ["ignore", "update"]
+
+
+# Campos de una función que no forman parte de su clave
+SHOWTIME_CONTENT_FIELDS = ["url"]
+
+
+def get_showtime_key(showtime: CinemaShowtime) -> tuple:
+    return tuple(getattr(showtime, field) for field in SHOWTIME_KEY_FIELDS)
+
+
+def get_showtime_scope(showtime_data: dict) -> tuple:
+    # Una sincronización reemplaza las funciones de cada cine y fecha enviados
+    date = showtime_data.get("date")
+    return (showtime_data.get("cinema_name"), None if date is None else str(date))
+
+
+def get_stored_showtime_scope(showtime: CinemaShowtime) -> tuple:
+    return (showtime.cinema_name, str(showtime.date))
+
+
+def ingest_showtimes(
+    showtimes_data: list[dict], batch_size: int = INGEST_BATCH_SIZE, on_conflict: str = "ignore"
+) -> dict:
+    """
+    Guarda funciones en lotes sin duplicar las que ya existen.
+    Con on_conflict="ignore" las funciones existentes se dejan como están; con
+    "update" se reescriben las que cambiaron fuera de la clave (la url). Las que
+    otra petición insertó entre la lectura y el insert cuentan como sin cambios.
+    """
+    if on_conflict not in ON_CONFLICT_CHOICES:
+        raise ValueError(f"on_conflict debe ser uno de {ON_CONFLICT_CHOICES}")
+
+    # Si una función llega repetida se guarda su última aparición
+    showtimes = {}
+
+    for showtime_data in showtimes_data:
+        showtime = CinemaShowtime(**showtime_data)
+        showtime.content_hash = get_content_hash(
+            [getattr(showtime, field) for field in SHOWTIME_CONTENT_FIELDS]
+        )
+        showtimes[get_showtime_key(showtime)] = showtime
+
+    # Una sola consulta acotada por película y fecha para encontrar las que ya existen
+    existing_showtimes = {
+        tuple(key): (showtime_id, content_hash)
+        for showtime_id, *key, content_hash in CinemaShowtime.objects.filter(
+            movie_id__in={key[0] for key in showtimes},
+            date__in={key[4] for key in showtimes},
+        ).values_list("id", *SHOWTIME_KEY_FIELDS, "content_hash")
+    }
+
+    now = timezone.now()
+    showtimes_to_create = []
+    showtimes_to_update = []
+
+    for key, showtime in showtimes.items():
+        showtime_id, stored_hash = existing_showtimes.get(key, (None, None))
+
+        if showtime_id is None:
+            showtimes_to_create.append(showtime)
+
+        elif on_conflict == "update" and stored_hash != showtime.content_hash:
+            showtime.id = showtime_id
+            showtime.updated_at = now
+            showtimes_to_update.append(showtime)
+
+    created = 0
+
+    with transaction.atomic():
+        if showtimes_to_create:
+            # ignore_conflicts cubre las funciones que otra petición insertó mientras tanto
+            CinemaShowtime.objects.bulk_create(
+                showtimes_to_create, batch_size=batch_size, ignore_conflicts=True
+            )
+            # Esas no se insertaron: solo cuentan como creadas las filas guardadas con el
+            # created_at que este insert les puso
+            created_at = {
+                get_showtime_key(showtime): showtime.created_at for showtime in showtimes_to_create
+            }
+            created = sum(
+                1
+                for *key, stored_created_at in CinemaShowtime.objects.filter(
+                    movie_id__in={key[0] for key in created_at},
+                    date__in={key[4] for key in created_at},
+                ).values_list(*SHOWTIME_KEY_FIELDS, "created_at")
+                if created_at.get(tuple(key)) == stored_created_at
+            )
+
+        CinemaShowtime.objects.bulk_update(
+            showtimes_to_update,
+            SHOWTIME_CONTENT_FIELDS + ["content_hash", "updated_at"],
+            batch_size=batch_size,
+        )
+
+        if created or showtimes_to_update:
+            bump_data_version()
+
+    changed_scopes = {
+        get_stored_showtime_scope(showtime)
+        for showtime in (showtimes_to_create if created else []) + showtimes_to_update
+    }
+
+    return {
+        "created": created,
+        "updated": len(showtimes_to_update),
+        "unchanged": len(showtimes) - created - len(showtimes_to_update),
+        "changed_scopes": [list(scope) for scope in sorted(changed_scopes)],
+    }
+
+
+def delete_missing_showtimes(seen_keys: set, scopes: set) -> dict:
+    """Borra las funciones de los (cine, fecha) en `scopes` que no están en `seen_keys`"""
+    deleted_ids = []
+    changed_scopes = set()
+
+    for showtime in CinemaShowtime.objects.filter(
+        cinema_name__in={cinema_name for cinema_name, _ in scopes},
+        date__in={date for _, date in scopes},
+    ).only("id", *SHOWTIME_KEY_FIELDS):
+        scope = get_stored_showtime_scope(showtime)
+
+        if scope in scopes and get_showtime_key(showtime) not in seen_keys:
+            deleted_ids.append(showtime.id)
+            changed_scopes.add(scope)
+
+    deleted = delete_in_batches(CinemaShowtime.objects.all(), deleted_ids)
+
+    return {
+        "deleted": deleted,
+        "changed_scopes": [list(scope) for scope in sorted(changed_scopes)],
+    }
+
+
+# Campos comunes a todas las funciones de un grupo en el formato agrupado
+SHOWTIME_GROUP_FIELDS = ["cinema_name", "date", "url"]
+
+
+def pack_showtimes(showtimes: list[dict]) -> list[dict]:
+    """
+    Agrupa funciones planas en el formato compacto que acepta create_showtimes:
+    {"movie" o "title", "cinema_name", "date", "url", "rooms": {sala: {formato: [horarios]}}}.
+    Cada grupo lleva una sola vez los datos que las funciones planas repiten.
+    """
+    groups = {}
+
+    for showtime in showtimes:
+        # La película va por id o, si la fila no lo trae, por su título
+        group_fields = ["movie" if "movie" in showtime else "title"] + SHOWTIME_GROUP_FIELDS
+        key = tuple((field, showtime[field]) for field in group_fields)
+
+        if key not in groups:
+            groups[key] = dict(key)
+            groups[key]["rooms"] = {}
+
+        formats = groups[key]["rooms"].setdefault(showtime["room"], {})
+        formats.setdefault(showtime["format"], []).append(showtime["schedule"])
+
+    return list(groups.values())
+
+
+def expand_showtimes(rows: list[dict]) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Convierte los grupos del formato compacto en funciones planas; el resto pasa
+    igual. Devuelve las funciones, la ubicación de cada una en el cuerpo enviado
+    (su fila y, dentro de un grupo, la sala, el formato y la posición del horario)
+    y los errores de los grupos mal formados, que no se expanden.
+    """
+    showtimes = []
+    locations = []
+    errors = []
+
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict) or "rooms" not in row:
+            showtimes.append(row)
+            locations.append({"index": index})
+            continue
+
+        rooms = row["rooms"]
+
+        if not isinstance(rooms, dict) or not all(
+            isinstance(formats, dict)
+            and all(isinstance(schedules, list) for schedules in formats.values())
+            for formats in rooms.values()
+        ):
+            errors.append(
+                {"index": index, "errors": {"rooms": ["Debe tener la forma {sala: {formato: [horarios]}}"]}}
+            )
+            continue
+
+        showtime = {field: value for field, value in row.items() if field != "rooms"}
+
+        for room, formats in rooms.items():
+            for format, schedules in formats.items():
+                for schedule_index, schedule in enumerate(schedules):
+                    showtimes.append({**showtime, "room": room, "format": format, "schedule": schedule})
+                    locations.append(
+                        {"index": index, "room": room, "format": format, "schedule_index": schedule_index}
+                    )
+
+    return showtimes, locations, errors
+
+
+def validate_rows(serializer_class, rows: list[dict], partial: bool) -> tuple[list[dict], list[dict]]:
+    """
+    Sin `partial` una fila inválida rechaza todas (ValidationError). Con
+    `partial` se devuelven las filas válidas y los errores de las demás.
+    """
+    serializer = serializer_class(data=rows, many=True)
+
+    if not partial:
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data, []
+
+    return serializer.validate_rows(rows)
+
+
+def format_errors(errors) -> str:
+    # {"campo": ["mensaje", ...]} -> "campo: mensaje"
+    if isinstance(errors, dict):
+        return "; ".join(f"{field}: {format_errors(messages)}" for field, messages in errors.items())
+
+    if isinstance(errors, list):
+        return " ".join(format_errors(message) for message in errors)
+
+    return str(errors)
+
+
+def format_error_location(error: dict) -> str:
+    # "fila 3" o, en un grupo de funciones, "fila 3 (sala 1, formato 2D, horario 0)"
+    location = f"fila {error['index']}"
+
+    if "room" in error:
+        location += (
+            f" (sala {error['room']}, formato {error['format']}, horario {error['schedule_index']})"
+        )
+
+    return location
+
+
+def get_row_errors(errors: list[dict], row_count: int) -> list[dict]:
+    """
+    Errores en la forma de ListSerializer: uno por fila enviada, {} si es válida.
+    Los de un grupo de funciones se anidan por sala, formato y posición del horario.
+    """
+    row_errors = [{} for _ in range(row_count)]
+
+    for error in errors:
+        if "room" not in error:
+            row_errors[error["index"]] = error["errors"]
+            continue
+
+        formats = row_errors[error["index"]].setdefault("rooms", {}).setdefault(error["room"], {})
+        formats.setdefault(error["format"], {})[error["schedule_index"]] = error["errors"]
+
+    return row_errors
+
+
+def get_skipped_scopes(rows: list[dict], errors: list[dict], get_scope: Callable) -> set | None:
+    """
+    Alcances que una sincronización no debe podar porque alguna de sus filas
+    fue inválida. None si una fila inválida no permite saber su alcance.
+    """
+    skipped_scopes = set()
+
+    for error in errors:
+        row = rows[error["index"]]
+
+        if not isinstance(row, dict):
+            return None
+
+        scope = get_scope(row)
+
+        if None in (scope if isinstance(scope, tuple) else (scope,)):
+            return None
+
+        skipped_scopes.add(scope)
+
+    return skipped_scopes
+
+
+def merge_results(totals: dict, result: dict, offset: int = 0) -> dict:
+    """Suma el resultado de un lote a los totales de la petición"""
+    for key, value in result.items():
+        if key == "errors":
+            # Posición de cada fila inválida dentro de todo el cuerpo, no del lote
+            totals.setdefault(key, []).extend(
+                {**error, "index": offset + error["index"]} for error in value
+            )
+
+        elif isinstance(value, list):
+            merged = totals.setdefault(key, [])
+            merged.extend(item for item in value if item not in merged)
+
+        else:
+            totals[key] = totals.get(key, 0) + value
+
+    return totals
+
+
+class SyncScopes:
+    """
+    Claves vistas y alcances de una sincronización. Un cuerpo en streaming se
+    guarda en varios lotes: las claves se juntan de todos y lo que desapareció
+    se borra una sola vez al final, para que un lote no pode las filas de otro.
+    """
+
+    def __init__(self) -> None:
+        self.delete_missing = None
+        self.seen_keys = set()
+        self.scopes = set()
+        self.skipped_scopes = set()
+        self.skip_all = False
+
+    def add(self, delete_missing: Callable, seen_keys: set, scopes: set, skipped_scopes: set | None) -> None:
+        self.delete_missing = delete_missing
+        self.seen_keys |= seen_keys
+        self.scopes |= scopes
+
+        if skipped_scopes is None:
+            self.skip_all = True
+        else:
+            self.skipped_scopes |= skipped_scopes
+
+    def finish(self) -> dict:
+        if self.delete_missing is None or self.skip_all:
+            return {"deleted": 0}
+
+        return self.delete_missing(self.seen_keys, self.scopes - self.skipped_scopes)
+
+
+def sync_rows(sync: bool | SyncScopes, result: dict, *scope_data) -> None:
+    # Con un SyncScopes compartido la poda queda para el final de la petición
+    sync_scopes = sync if isinstance(sync, SyncScopes) else SyncScopes()
+    sync_scopes.add(*scope_data)
+
+    if sync_scopes is not sync:
+        merge_results(result, sync_scopes.finish())
+
+
+def save_movies(
+    movies_data: list[dict],
+    batch_size: int = INGEST_BATCH_SIZE,
+    partial: bool = False,
+    sync: bool | SyncScopes = False,
+) -> dict:
+    """
+    Valida y guarda películas. Con `partial` las filas inválidas se reportan en
+    "errors"; con `sync` se borran las películas de cada cine que ya no llegan.
+    """
+    valid_movies, errors = validate_rows(MovieIngestSerializer, movies_data, partial)
+    result = upsert_movies(valid_movies, batch_size)
+    result["deleted"] = 0
+
+    if sync:
+        sync_rows(
+            sync,
+            result,
+            delete_missing_movies,
+            {(movie["cinema_name"], movie["title"]) for movie in valid_movies},
+            {movie["cinema_name"] for movie in valid_movies},
+            get_skipped_scopes(movies_data, errors, get_movie_scope),
+        )
+
+    if partial:
+        result["errors"] = errors
+
+    return result
+
+
+def save_showtimes(
+    showtimes_data: list[dict],
+    batch_size: int = INGEST_BATCH_SIZE,
+    on_conflict: str = "ignore",
+    partial: bool = False,
+    sync: bool | SyncScopes = False,
+) -> dict:
+    """
+    Valida y guarda funciones, planas o agrupadas. Con `partial` las filas
+    inválidas se reportan en "errors"; con `sync` se borran las funciones de cada
+    cine y fecha que ya no llegan.
+    """
+    showtimes, locations, errors = expand_showtimes(showtimes_data)
+    # Los errores se reportan en la fila enviada (y su lugar en el grupo), no en la función expandida
+    valid_showtimes, row_errors = validate_rows(
+        CinemaShowtimeIngestSerializer, showtimes, partial=True
+    )
+    errors = sorted(
+        errors + [{**locations[error["index"]], "errors": error["errors"]} for error in row_errors],
+        key=lambda error: error["index"],
+    )
+
+    if errors and not partial:
+        raise ValidationError(get_row_errors(errors, len(showtimes_data)))
+
+    result = ingest_showtimes(valid_showtimes, batch_size, on_conflict)
+    result["deleted"] = 0
+
+    if sync:
+        showtimes = [CinemaShowtime(**showtime_data) for showtime_data in valid_showtimes]
+        sync_rows(
+            sync,
+            result,
+            delete_missing_showtimes,
+            {get_showtime_key(showtime) for showtime in showtimes},
+            {get_stored_showtime_scope(showtime) for showtime in showtimes},
+            get_skipped_scopes(showtimes_data, errors, get_showtime_scope),
+        )
+
+    if partial:
+        result["errors"] = errors
+
+    return result
+
+
+def save_in_batches(
+    rows: Iterable[dict], save: Callable[..., dict], batch_size: int = INGEST_BATCH_SIZE, **options
+) -> dict:
+    """
+    Guarda las filas de un cuerpo en streaming con `save` (save_movies o
+    save_showtimes) de a `batch_size`, confirmando cada lote por separado para
+    que la memoria no crezca con el tamaño de la petición.
+    """
+    rows = iter(rows)
+    totals = {}
+    start = 0
+
+    if options.get("sync"):
+        options["sync"] = SyncScopes()
+
+    while batch := list(islice(rows, batch_size)):
+        try:
+            result = save(batch, batch_size, **options)
+
+        except ValidationError as e:
+            # Los lotes anteriores ya quedaron guardados; reenviar el bloque no los duplica
+            raise ValidationError({"row": start, "errors": e.detail})
+
+        merge_results(totals, result, start)
+        start += len(batch)
+
+    if options.get("sync"):
+        merge_results(totals, options["sync"].finish())
+
+    return totals
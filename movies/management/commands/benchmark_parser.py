@@ -0,0 +1,89 @@
+from bs4 import SoupStrainer
+from django.core.management.base import BaseCommand
+from movies.scraping.parsers import LXML_AVAILABLE, PARSER_BACKENDS, HtmlParser
+from movies.scraping.scraper import BeautifulSoupDriver
+import time
+import tracemalloc
+
+
+# Páginas medidas por defecto y las etiquetas que los scrapers realmente necesitan
+DEFAULT_PAGES = [
+    (
+        "https://www.cinecolombia.com/cali/cartelera",
+        SoupStrainer("a", class_="movie-item"),
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide el tiempo y la memoria máxima de parsear una página con cada backend "
+        "de HtmlParser, completa y parcialmente (SoupStrainer)"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--url", help="Página a descargar y medir")
+        parser.add_argument("--file", help="Archivo HTML local a medir")
+        parser.add_argument("--tag", help="Etiqueta para el parseo parcial, p. ej. div")
+        parser.add_argument("--class-name", help="Clase para el parseo parcial")
+        parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por medición")
+
+    def handle(self, *args, **kwargs) -> None:
+        if not LXML_AVAILABLE:
+            self.stdout.write(self.style.WARNING("lxml no está instalado: solo se mide html.parser"))
+
+        for name, markup, strainer in self.get_pages(kwargs):
+            self.stdout.write(f"{name} ({len(markup) / 1024:.0f} KB)")
+
+            for backend in PARSER_BACKENDS:
+                if backend == "lxml" and not LXML_AVAILABLE:
+                    continue
+
+                html_parser = HtmlParser(backend)
+
+                for label, only in (("completo", None), ("parcial", strainer)):
+                    if label == "parcial" and only is None:
+                        continue
+
+                    elapsed, peak = self.measure(html_parser, markup, only, kwargs["repeat"])
+                    self.stdout.write(
+                        f"  {backend:<12} {label:<9} {elapsed * 1000:8.1f} ms  "
+                        f"{peak / 1024 / 1024:6.1f} MB de memoria máxima"
+                    )
+
+    def get_pages(self, options: dict) -> list[tuple[str, str, SoupStrainer | None]]:
+        strainer = None
+
+        if options["tag"] or options["class_name"]:
+            strainer_options = {"class_": options["class_name"]} if options["class_name"] else {}
+            strainer = SoupStrainer(options["tag"], **strainer_options)
+
+        if options["file"]:
+            with open(options["file"], encoding="utf-8") as html_file:
+                return [(options["file"], html_file.read(), strainer)]
+
+        bs_driver = BeautifulSoupDriver()
+
+        if options["url"]:
+            return [(options["url"], bs_driver.get_http_response(options["url"]).text, strainer)]
+
+        return [
+            (url, bs_driver.get_http_response(url).text, default_strainer)
+            for url, default_strainer in DEFAULT_PAGES
+        ]
+
+    def measure(self, html_parser: HtmlParser, markup: str, only, repeat: int) -> tuple[float, int]:
+        # Tiempo promedio por página y memoria máxima de una sola pasada
+        start = time.perf_counter()
+
+        for _ in range(repeat):
+            html_parser.parse(markup, only)
+
+        elapsed = (time.perf_counter() - start) / repeat
+
+        tracemalloc.start()
+        html_parser.parse(markup, only)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return elapsed, peak
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand
+from movies.scraping.cinemark_scraper import CineMarkScraper
+from movies.scraping.cinepolis_scraper import CinepolisScraper
+from movies.scraping.scraper import SeleniumDriver, driver_pool
+import time
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara la extracción elemento por elemento con WebDriver contra el modo "
+        "snapshot (page_source + parser) en las páginas de Cinepolis y CineMark"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="Veces que se mide cada modo",
+        )
+
+    def handle(self, *args, **kwargs) -> None:
+        benchmarks = [
+            ("Cinepolis películas", CinepolisScraper().movies_scraper, "extract_raw_movies"),
+            ("CineMark funciones", CineMarkScraper().showtimes_scraper, "scrape_showtimes"),
+        ]
+
+        selenium_driver = driver_pool.acquire()
+        commands = self.count_commands(selenium_driver)
+
+        try:
+            for name, scraper, method_name in benchmarks:
+                scraper.selenium_driver = selenium_driver
+
+                for snapshot_mode in (False, True):
+                    scraper.snapshot_mode = snapshot_mode
+                    mode = "snapshot" if snapshot_mode else "webdriver"
+
+                    for _ in range(kwargs["repeat"]):
+                        selenium_driver.get(scraper.url)
+                        commands["count"] = 0
+
+                        start = time.perf_counter()
+                        results = getattr(scraper, method_name)() or []
+                        elapsed = time.perf_counter() - start
+
+                        self.stdout.write(
+                            f"{name} [{mode}]: {elapsed:.2f} s, "
+                            f"{commands['count']} llamadas a WebDriver, {len(results)} resultados"
+                        )
+
+        finally:
+            driver_pool.release(selenium_driver)
+            driver_pool.close()
+
+    def count_commands(self, selenium_driver: SeleniumDriver) -> dict:
+        # Cada find_element, get_attribute o .text pasa por execute: contar esas llamadas
+        commands = {"count": 0}
+        execute = selenium_driver.driver.execute
+
+        def counting_execute(driver_command, params=None):
+            commands["count"] += 1
+            return execute(driver_command, params)
+
+        selenium_driver.driver.execute = counting_execute
+
+        return commands
@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from movies.models import Movie, CinemaShowtime
+import datetime
+
+
+class Command(BaseCommand):
+    help = (
+        "Muestra el plan de ejecución de las consultas principales sobre películas "
+        "y funciones, para comprobar que usan los índices"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--date",
+            type=datetime.date.fromisoformat,
+            default=datetime.date.today(),
+            help="Fecha de las consultas de funciones (YYYY-MM-DD, por defecto hoy)",
+        )
+        parser.add_argument(
+            "--cinema",
+            help="Cine de las consultas (por defecto el de la primera película guardada)",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Ejecutar las consultas y mostrar tiempos reales (solo PostgreSQL)",
+        )
+
+    def handle(self, *args, **kwargs) -> None:
+        date = kwargs["date"]
+        movie = Movie.objects.order_by("id").first()
+        cinema_name = kwargs["cinema"] or (movie.cinema_name if movie else "")
+        title = movie.title if movie else ""
+        movie_id = movie.id if movie else 0
+
+        queries = [
+            (
+                "Película por cine y título",
+                Movie.objects.filter(cinema_name=cinema_name, title=title),
+            ),
+            (
+                "Cartelera de un cine",
+                Movie.objects.filter(cinema_name=cinema_name).order_by("title"),
+            ),
+            (
+                "Funciones de un día",
+                CinemaShowtime.objects.filter(date=date).order_by("schedule"),
+            ),
+            (
+                "Funciones de un día en un cine",
+                CinemaShowtime.objects.filter(date=date, cinema_name=cinema_name).order_by("schedule"),
+            ),
+            (
+                "Funciones de un día desde una hora",
+                CinemaShowtime.objects.filter(date=date, schedule__gte=datetime.time(18)).order_by(
+                    "schedule"
+                ),
+            ),
+            (
+                "Funciones de una película en un día",
+                CinemaShowtime.objects.filter(movie_id=movie_id, date=date),
+            ),
+        ]
+
+        explain_options = {}
+
+        if kwargs["analyze"]:
+            if connection.vendor == "postgresql":
+                explain_options = {"analyze": True, "buffers": True}
+            else:
+                self.stdout.write(
+                    self.style.WARNING(f"--analyze no está disponible en {connection.vendor}")
+                )
+
+        for name, queryset in queries:
+            self.stdout.write(self.style.SUCCESS(f"== {name} =="))
+            self.stdout.write(str(queryset.query))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write("")
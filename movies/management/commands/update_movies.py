@@ -4,59 +4,148 @@ from movies.scraping.cinepolis_scraper import CinepolisScraper
 from movies.scraping.cinemark_scraper import CineMarkScraper
 from movies.scraping.izimovie_scraper import IziMovieScraper
 from movies.scraping.royalfilms_scraper import RoyalFilmsScraper
-import requests
+from movies.scraping.runner import EXECUTORS, run_scrapers
+from movies.scraping.scraper import driver_pool
+from movies.ingestion import format_errors, get_movie_scope, save_movies
+from django.conf import settings
+from movies.upload import ChunkUploader
+from urllib.parse import urljoin
+
+
+SINKS = ["http", "db"]
 
 
 class Command(BaseCommand):
     help = "Actualiza los datos utilizando web scraping"
 
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Número de scrapers que se ejecutan en paralelo (1 = uno tras otro)",
+        )
+        parser.add_argument(
+            "--executor",
+            choices=sorted(EXECUTORS),
+            default="thread",
+            help="Tipo de pool usado cuando --workers es mayor que 1",
+        )
+        parser.add_argument(
+            "--sink",
+            choices=SINKS,
+            default="http",
+            help="Dónde guardar los datos: db escribe directo en la base de datos, http los envía a la API",
+        )
+        parser.add_argument(
+            "--api-url",
+            default=settings.CALINEMA_API_URL,
+            help="URL base de la API usada con --sink http",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Filas por bloque enviado a la API con --sink http",
+        )
+        parser.add_argument(
+            "--upload-workers",
+            type=int,
+            default=1,
+            help="Bloques que se envían a la API en paralelo",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Borrar lo que ya no aparece en el scraping de cada cine",
+        )
+
     def handle(self, *args, **kwargs) -> None:
         scrapers = [
-            CineColombiaScraper(),
-            CinepolisScraper(),
-            CineMarkScraper(),
-            IziMovieScraper(),
-            RoyalFilmsScraper(),
+            CineColombiaScraper,
+            CinepolisScraper,
+            CineMarkScraper,
+            IziMovieScraper,
+            RoyalFilmsScraper,
         ]
 
         all_movies = []
 
-        for scraper in scrapers:
-            try:
-                cinema_movies = scraper.get_movies()
-                all_movies.extend(cinema_movies)
+        results = run_scrapers(
+            scrapers, "get_movies", kwargs["workers"], kwargs["executor"]
+        )
+        self.report_driver_pool()
 
-            except Exception as e:
+        for scraper, cinema_movies, error in results:
+            if error:
                 self.stdout.write(
-                    self.style.ERROR(
-                        f"Error al procesar {scraper.__class__.__name__}: {str(e)}"
-                    )
+                    self.style.ERROR(f"Error al procesar {scraper.__name__}: {error}")
                 )
+                continue
 
-        # Enviar los datos recolectados a la API después del scraping
-        self.send_data_to_api(all_movies)
+            if cinema_movies:
+                all_movies.extend(cinema_movies)
 
-    def send_data_to_api(self, movies: list[dict]) -> None:
-        post_url = "https://api-calinema.onrender.com/api/create_movies/"
+        if kwargs["sink"] == "db":
+            self.save_to_db(all_movies, kwargs["sync"])
+        else:
+            # Enviar los datos recolectados a la API después del scraping
+            self.send_data_to_api(all_movies, kwargs)
 
-        # Enviar los datos a la API
-        try:
-            response = requests.post(post_url, json=movies)
+    def report_driver_pool(self) -> None:
+        driver_pool.close()
+        stats = driver_pool.get_stats()
 
-            if response.status_code == 201:
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        "Datos enviados correctamente a la API y guardados en la base de datos."
-                    )
-                )
-            else:
-                self.stdout.write(
-                    self.style.ERROR(
-                        f"Error al enviar datos a la API: {response.status_code} {response.text}"
-                    )
+        if stats["leases"]:
+            self.stdout.write(
+                f"Navegadores: {stats['launches']} lanzados, "
+                f"{stats['launches_saved']} lanzamientos ahorrados por el pool, "
+                f"{stats['recycled']} reciclados"
+            )
+
+    def save_to_db(self, movies: list[dict], sync: bool) -> None:
+        # Guardar las filas válidas aunque alguna venga mal: no repetir todo el scraping por una
+        result = save_movies(movies, partial=True, sync=sync)
+
+        for error in result["errors"]:
+            row = movies[error["index"]]
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Película '{row.get('title')}' inválida: {format_errors(error['errors'])}"
                 )
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Datos guardados en la base de datos: "
+                f"{result['created']} creadas, {result['updated']} actualizadas, "
+                f"{result['unchanged']} sin cambios, {result['deleted']} borradas."
+            )
+        )
+
+    def send_data_to_api(self, movies: list[dict], options: dict) -> None:
+        post_url = urljoin(options["api_url"], "create_movies/?partial=true")
 
-        except Exception as e:
+        if options["sync"]:
+            post_url += "&sync=true"
+        uploader = ChunkUploader(options["chunk_size"], options["upload_workers"])
+
+        # Enviar los datos a la API en bloques comprimidos
+        try:
+            # Las filas de un mismo cine viajan juntas para que la sincronización no las separe
+            result, errors = uploader.upload(post_url, movies, get_movie_scope)
+
+        finally:
+            uploader.close()
+
+        for error in errors:
+            self.stdout.write(self.style.ERROR(f"Error al enviar datos a la API: {error}"))
+
+        if result:
             self.stdout.write(
-                self.style.ERROR(f"Error al enviar datos a la API: {str(e)}")
+                self.style.SUCCESS(
+                    "Datos enviados correctamente a la API y guardados en la base de datos: "
+                    f"{result['created']} creadas, {result['updated']} actualizadas, "
+                    f"{result['unchanged']} sin cambios, {result['deleted']} borradas."
+                )
             )
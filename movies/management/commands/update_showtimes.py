@@ -1,76 +1,115 @@
 import datetime
 from django.core.management.base import BaseCommand
-from movies.models import Movie
+from movies.ingestion import (
+    format_errors,
+    get_showtime_scope,
+    pack_showtimes,
+    save_showtimes,
+)
 from movies.scraping.cinecolombia_scraper import CineColombiaScraper
 from movies.scraping.cinepolis_scraper import CinepolisScraper
 from movies.scraping.cinemark_scraper import CineMarkScraper
 from movies.scraping.izimovie_scraper import IziMovieScraper
 from movies.scraping.royalfilms_scraper import RoyalFilmsScraper
-from movies.serializers import CinemaShowtimeSerializer
+from movies.scraping.runner import EXECUTORS, run_scrapers
+from movies.scraping.scraper import driver_pool
 from django.db import transaction
 from django.conf import settings
-import requests
+from movies.upload import ChunkUploader
+from urllib.parse import urljoin
 import json
 from datetime import date
 
 
+SINKS = ["http", "db"]
+
+WIRE_FORMATS = ["grouped", "flat"]
+
+
 class Command(BaseCommand):
     help = "Actualiza los datos de funciones de las películas utilizando web scraping"
 
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Número de scrapers que se ejecutan en paralelo (1 = uno tras otro)",
+        )
+        parser.add_argument(
+            "--executor",
+            choices=sorted(EXECUTORS),
+            default="thread",
+            help="Tipo de pool usado cuando --workers es mayor que 1",
+        )
+        parser.add_argument(
+            "--sink",
+            choices=SINKS,
+            default="http",
+            help="Dónde guardar los datos: db escribe directo en la base de datos, http los envía a la API",
+        )
+        parser.add_argument(
+            "--api-url",
+            default=settings.CALINEMA_API_URL,
+            help="URL base de la API usada con --sink http",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Filas por bloque enviado a la API con --sink http",
+        )
+        parser.add_argument(
+            "--upload-workers",
+            type=int,
+            default=1,
+            help="Bloques que se envían a la API en paralelo",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Borrar lo que ya no aparece en el scraping de cada cine y fecha",
+        )
+        parser.add_argument(
+            "--wire-format",
+            choices=WIRE_FORMATS,
+            default="grouped",
+            help="grouped envía sala -> formato -> [horarios] por película; flat, una fila por función",
+        )
+
     def handle(self, *args, **kwargs):
-        scrapers = [CineColombiaScraper(), CinepolisScraper(), CineMarkScraper(), IziMovieScraper(), RoyalFilmsScraper()]
+        scrapers = [CineColombiaScraper, CinepolisScraper, CineMarkScraper, IziMovieScraper, RoyalFilmsScraper]
 
         all_showtimes = []
 
-        for scraper in scrapers:
-            try:
-                cinema_name = scraper.get_cinema_name()
-                cinema_showtimes = self.get_showtimes(scraper, cinema_name)
-                if cinema_showtimes:
-                    # Asignar la ID de la película correspondiente a cada función
-                    for showtime in cinema_showtimes:
-                        showtime_with_id = self.add_movie_id(showtime)
-                        if showtime_with_id:
-                            all_showtimes.append(showtime_with_id)
-
-            except Exception as e:
+        results = run_scrapers(
+            scrapers, "get_showtimes", kwargs["workers"], kwargs["executor"]
+        )
+        self.report_driver_pool()
+
+        for scraper, cinema_showtimes, error in results:
+            if error:
                 self.stdout.write(
-                    self.style.ERROR(
-                        f"Error al procesar {scraper.__class__.__name__}: {str(e)}"
-                    )
+                    self.style.ERROR(f"Error al procesar {scraper.__name__}: {error}")
                 )
-        # Convertir las fechas a cadenas
-        self.convert_dates_to_str(all_showtimes)
-        # Enviar los datos recolectados a la API después del scraping
-        self.send_data_to_api(all_showtimes)
-
-    def get_showtimes(
-        self, cinema_scraper: object, cinema_name: str
-    ) -> list[dict] | None:
-        try:
-            cinema_showtimes = cinema_scraper.get_showtimes()
-            return cinema_showtimes
+                continue
 
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f"Error al hacer el scraping de {cinema_name}: {e}")
-            )
-            return None
+            if cinema_showtimes:
+                # Cada función lleva el título de su película: el servidor que la guarda
+                # busca la ID por (cinema_name, title), con una consulta por lote
+                all_showtimes.extend(cinema_showtimes)
 
-    def add_movie_id(self, showtime: dict) -> dict | None:
-        # Buscar la primera película que coincida con el título
-        movie = Movie.objects.filter(
-            title=showtime["title"], cinema_name=showtime["cinema_name"]
-        ).first()
+        if kwargs["sink"] == "db":
+            self.save_to_db(all_showtimes, kwargs["sync"])
+        else:
+            # Convertir las fechas a cadenas
+            self.convert_dates_to_str(all_showtimes)
 
-        if movie is None:
-            self.stdout.write(
-                self.style.ERROR(f"Película '{showtime['title']}' no encontrada")
-            )
-            return None
+            if kwargs["wire_format"] == "grouped":
+                all_showtimes = pack_showtimes(all_showtimes)
 
-        showtime["movie"] = movie.id
-        return showtime
+            # Enviar los datos recolectados a la API después del scraping
+            self.send_data_to_api(all_showtimes, kwargs)
 
     def convert_dates_to_str(self, data):
         """Convierte fechas en un diccionario a cadenas en formato YYYY-MM-DD"""
@@ -86,27 +125,60 @@ class Command(BaseCommand):
                 elif isinstance(value, dict) or isinstance(value, list):
                     self.convert_dates_to_str(value)
 
-    def send_data_to_api(self, showtimes: list[dict]) -> None:
-        post_url = "https://api-calinema.onrender.com/api/create_showtimes/"
+    def report_driver_pool(self) -> None:
+        driver_pool.close()
+        stats = driver_pool.get_stats()
 
-        # Enviar los datos a la API
-        try:
-            response = requests.post(post_url, json=showtimes)
+        if stats["leases"]:
+            self.stdout.write(
+                f"Navegadores: {stats['launches']} lanzados, "
+                f"{stats['launches_saved']} lanzamientos ahorrados por el pool, "
+                f"{stats['recycled']} reciclados"
+            )
 
-            if response.status_code == 201:
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        "Funciones de películas enviadas correctamente a la API."
-                    )
-                )
-            else:
-                self.stdout.write(
-                    self.style.ERROR(
-                        f"Error al enviar datos: {response.status_code} {response.text}"
-                    )
+    def save_to_db(self, showtimes: list[dict], sync: bool) -> None:
+        # Guardar las filas válidas aunque alguna venga mal: no repetir todo el scraping por una
+        result = save_showtimes(showtimes, partial=True, sync=sync)
+
+        for error in result["errors"]:
+            row = showtimes[error["index"]]
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Función '{row.get('title')}' inválida: {format_errors(error['errors'])}"
                 )
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Funciones de películas guardadas en la base de datos: "
+                f"{result['created']} creadas, {result['updated']} actualizadas, "
+                f"{result['unchanged']} sin cambios, {result['deleted']} borradas."
+            )
+        )
 
-        except Exception as e:
+    def send_data_to_api(self, showtimes: list[dict], options: dict) -> None:
+        post_url = urljoin(options["api_url"], "create_showtimes/?partial=true")
+
+        if options["sync"]:
+            post_url += "&sync=true"
+        uploader = ChunkUploader(options["chunk_size"], options["upload_workers"])
+
+        # Enviar los datos a la API en bloques comprimidos
+        try:
+            # Las filas de un mismo cine y fecha viajan juntas para que la sincronización no las separe
+            result, errors = uploader.upload(post_url, showtimes, get_showtime_scope)
+
+        finally:
+            uploader.close()
+
+        for error in errors:
+            self.stdout.write(self.style.ERROR(f"Error al enviar datos a la API: {error}"))
+
+        if result:
             self.stdout.write(
-                self.style.ERROR(f"Error al enviar datos a la API: {str(e)}")
+                self.style.SUCCESS(
+                    "Funciones de películas enviadas correctamente a la API: "
+                    f"{result['created']} creadas, {result['updated']} actualizadas, "
+                    f"{result['unchanged']} sin cambios, {result['deleted']} borradas."
+                )
             )
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovieMetadata',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cinema_name', models.CharField(max_length=100)),
+                ('key', models.CharField(max_length=500)),
+                ('data', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='moviemetadata',
+            constraint=models.UniqueConstraint(fields=('cinema_name', 'key'), name='unique_movie_metadata'),
+        ),
+    ]
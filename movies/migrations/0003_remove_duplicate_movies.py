@@ -0,0 +1,38 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:23
+
+from django.db import migrations
+
+
+def remove_duplicate_movies(apps, schema_editor):
+    # Cada actualización diaria duplicaba las películas: se conserva la más reciente
+    # de cada (cinema_name, title) y sus funciones pasan a apuntar a ella
+    Movie = apps.get_model('movies', 'Movie')
+    CinemaShowtime = apps.get_model('movies', 'CinemaShowtime')
+    kept_movies = {}
+    duplicates = {}
+
+    for movie_id, cinema_name, title in Movie.objects.order_by('-id').values_list('id', 'cinema_name', 'title'):
+        key = (cinema_name, title)
+
+        if key not in kept_movies:
+            kept_movies[key] = movie_id
+            continue
+
+        duplicates.setdefault(kept_movies[key], []).append(movie_id)
+
+    for kept_movie_id, duplicate_ids in duplicates.items():
+        CinemaShowtime.objects.filter(movie_id__in=duplicate_ids).update(movie_id=kept_movie_id)
+        Movie.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0002_moviemetadata'),
+    ]
+
+    # La restricción única va en la siguiente migración: en PostgreSQL no se puede
+    # alterar la tabla en la misma transacción que borró filas referenciadas
+    operations = [
+        migrations.RunPython(remove_duplicate_movies, migrations.RunPython.noop),
+    ]
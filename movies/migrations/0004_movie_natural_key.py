@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0003_remove_duplicate_movies'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='movie',
+            constraint=models.UniqueConstraint(fields=('cinema_name', 'title'), name='unique_movie_per_cinema'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:24
+
+from django.db import migrations
+
+
+SHOWTIME_KEY_FIELDS = ('movie_id', 'cinema_name', 'room', 'format', 'date', 'schedule')
+
+
+def remove_duplicate_showtimes(apps, schema_editor):
+    # Volver a ejecutar update_showtimes el mismo día duplicaba las funciones: conservar la más reciente
+    CinemaShowtime = apps.get_model('movies', 'CinemaShowtime')
+    seen_keys = set()
+    duplicate_ids = []
+
+    for showtime_id, *key in CinemaShowtime.objects.order_by('-id').values_list('id', *SHOWTIME_KEY_FIELDS):
+        key = tuple(key)
+
+        if key in seen_keys:
+            duplicate_ids.append(showtime_id)
+        else:
+            seen_keys.add(key)
+
+    for start in range(0, len(duplicate_ids), 500):
+        CinemaShowtime.objects.filter(id__in=duplicate_ids[start:start + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0004_movie_natural_key'),
+    ]
+
+    # La restricción única va en la siguiente migración: en PostgreSQL no se puede
+    # alterar la tabla en la misma transacción que borró filas
+    operations = [
+        migrations.RunPython(remove_duplicate_showtimes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_remove_duplicate_showtimes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='cinemashowtime',
+            constraint=models.UniqueConstraint(fields=('movie', 'cinema_name', 'room', 'format', 'date', 'schedule'), name='unique_showtime'),
+        ),
+    ]
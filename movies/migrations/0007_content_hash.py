@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0006_showtime_natural_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cinemashowtime',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
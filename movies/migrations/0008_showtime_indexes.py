@@ -0,0 +1,21 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cinemashowtime',
+            index=models.Index(fields=['date', 'cinema_name', 'schedule'], name='showtime_date_cinema_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cinemashowtime',
+            index=models.Index(fields=['date', 'schedule', 'id'], name='showtime_date_schedule_id_idx'),
+        ),
+    ]
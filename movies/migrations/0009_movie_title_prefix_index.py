@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0008_showtime_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['title'], name='movie_title_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:48
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def create_data_version(apps, schema_editor):
+    # La fila única que comparten todos los procesos (ver movies.cache.DATA_VERSION_ID)
+    DataVersion = apps.get_model('movies', 'DataVersion')
+    DataVersion.objects.get_or_create(id=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0009_movie_title_prefix_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(create_data_version, migrations.RunPython.noop),
+    ]
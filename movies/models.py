@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 import datetime
 
 
@@ -15,9 +16,24 @@ class Movie(models.Model):
     language = models.CharField(max_length=100, blank=True)
     synopsis = models.TextField(blank=True)
     image_url = models.URLField(max_length=200, blank=True, null=True)
+    # Hash de los campos scrapeados, para saber sin compararlos uno a uno si la película cambió
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cinema_name", "title"], name="unique_movie_per_cinema"
+            )
+        ]
+        indexes = [
+            # Búsqueda por prefijo del título (LIKE 'abc%'); en PostgreSQL necesita varchar_pattern_ops
+            models.Index(
+                fields=["title"], name="movie_title_prefix_idx", opclasses=["varchar_pattern_ops"]
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -30,8 +46,58 @@ class CinemaShowtime(models.Model):
     date = models.DateField(default=datetime.date.today)
     schedule = models.TimeField()
     url = models.URLField()
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["movie", "cinema_name", "room", "format", "date", "schedule"],
+                name="unique_showtime",
+            )
+        ]
+        # Los clientes consultan las funciones de un día, por cine y por horario
+        indexes = [
+            models.Index(
+                fields=["date", "cinema_name", "schedule"], name="showtime_date_cinema_idx"
+            ),
+            # También sirve el orden (date, schedule, id) de la paginación por cursor
+            models.Index(fields=["date", "schedule", "id"], name="showtime_date_schedule_id_idx"),
+        ]
+
     def __str__(self):
         return f"{self.movie.title} at {self.schedule} in {self.cinema_name}"
+
+
+class MovieMetadata(models.Model):
+    # Datos de la página de detalle de una película, para no volver a scrapearla cada día
+    cinema_name = models.CharField(max_length=100)
+    key = models.CharField(max_length=500)
+    data = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cinema_name", "key"], name="unique_movie_metadata"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.key} ({self.cinema_name})"
+
+
+class DataVersion(models.Model):
+    """
+    Una sola fila que cambia cada vez que se guardan películas o funciones. Vive
+    en la base de datos para que todos los procesos (workers de la API y comandos
+    de scraping con --sink db) vean la misma versión.
+    """
+
+    version = models.PositiveBigIntegerField(default=0)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Versión {self.version} ({self.changed_at})"
@@ -0,0 +1,125 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+import json
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginación por cursor sobre un orden estable e indexado (`ordering`).
+    El cursor guarda los valores de la última fila entregada y la página
+    siguiente se pide con WHERE (a, b, ...) > (...), así una página profunda
+    cuesta lo mismo que la primera (sin OFFSET).
+    """
+
+    ordering = ("id",)
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Cursor inválido"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position = self.decode_cursor(request, queryset.model)
+        queryset = queryset.order_by(*self.ordering)
+
+        if position is not None:
+            queryset = queryset.filter(self.get_after_filter(position))
+
+        # Pedir una fila de más para saber si hay página siguiente sin contar la tabla
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_position = None
+
+        if self.has_next:
+            self.next_position = [getattr(rows[-1], field) for field in self.ordering]
+
+        return rows
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    def get_after_filter(self, position: list) -> Q:
+        # (a, b, c) > (x, y, z)  <=>  a > x  OR  (a = x AND b > y)  OR  (a = x AND b = y AND c > z)
+        # Con a >= x delante el motor puede saltar en el índice hasta el cursor en lugar de recorrerlo
+        leading_bound = Q(**{f"{self.ordering[0]}__gte": position[0]})
+        after_filter = Q()
+
+        for index, field in enumerate(self.ordering):
+            equal_fields = {
+                previous_field: position[previous_index]
+                for previous_index, previous_field in enumerate(self.ordering[:index])
+            }
+            after_filter |= Q(**equal_fields, **{f"{field}__gt": position[index]})
+
+        return leading_bound & after_filter
+
+    def encode_cursor(self, position: list) -> str:
+        data = json.dumps(position, default=str).encode("utf-8")
+        return urlsafe_b64encode(data).decode("ascii")
+
+    def decode_cursor(self, request, model) -> list | None:
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        if not cursor:
+            return None
+
+        try:
+            position = json.loads(urlsafe_b64decode(cursor.encode("ascii")))
+
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError
+
+            return [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+
+        except (ValueError, TypeError, UnicodeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class MoviePagination(KeysetPagination):
+    # (cinema_name, title) es único: no hace falta desempatar por id
+    ordering = ("cinema_name", "title")
+
+
+class CinemaShowtimePagination(KeysetPagination):
+    ordering = ("date", "schedule", "id")
@@ -0,0 +1,62 @@
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from typing import Iterator
+import gzip
+import json
+
+
+class NDJSONParser(BaseParser):
+    """
+    Lee un cuerpo NDJSON (una fila JSON por línea), opcionalmente comprimido con
+    gzip. Devuelve un iterador: las filas se decodifican a medida que la vista
+    las consume, sin cargar todo el cuerpo en memoria.
+    """
+
+    media_type = "application/x-ndjson"
+    # Límites en bytes ya descomprimidos: un gzip pequeño puede expandirse a gigas
+    max_line_size = 1024 * 1024
+    max_body_size = 100 * 1024 * 1024
+
+    def parse(self, stream, media_type=None, parser_context=None) -> Iterator[dict]:
+        request = (parser_context or {}).get("request")
+
+        if stream is None:
+            return iter([])
+
+        if request is not None and request.META.get("HTTP_CONTENT_ENCODING") == "gzip":
+            stream = gzip.GzipFile(fileobj=stream)
+
+        return self.iter_rows(stream)
+
+    def iter_rows(self, stream) -> Iterator[dict]:
+        body_size = 0
+        line_number = 0
+
+        try:
+            while True:
+                # Leer con límite: una línea sin saltos no llega a cargarse entera en memoria
+                line = stream.readline(self.max_line_size + 1)
+
+                if not line:
+                    break
+
+                line_number += 1
+                body_size += len(line)
+
+                if len(line) > self.max_line_size:
+                    raise ParseError(f"Línea {line_number}: supera {self.max_line_size} bytes")
+
+                if body_size > self.max_body_size:
+                    raise ParseError(f"El cuerpo supera {self.max_body_size} bytes")
+
+                if not line.strip():
+                    continue
+
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise ParseError(f"Línea {line_number}: JSON inválido ({e})")
+
+        except (OSError, EOFError) as e:
+            # gzip corrupto o truncado
+            raise ParseError(f"Cuerpo comprimido inválido: {e}")
@@ -1,9 +1,12 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
+from movies.scraping.metadata_cache import MetadataCache
 from movies.scraping.scraper import (
     Scraper,
     BeautifulSoupMoviesScraper,
+    SeleniumDriver,
     SeleniumShowtimesScraper,
+    crawl_links,
 )
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -32,27 +35,49 @@ class CineColombiaMoviesScraper(BeautifulSoupMoviesScraper):
         super().__init__()
         self.cinema_name = cinema_name
         self.url = url
+        # Las páginas de detalle casi no cambian: se sirven desde la caché durante 12 horas
+        self.bs_driver.cache_max_age = 12 * 60 * 60
+        # Solo se parsean las películas de la cartelera y los bloques de detalle
+        self.movies_strainer = SoupStrainer("a", class_="movie-item")
+        self.details_strainer = SoupStrainer("div", class_="movie-details__block")
+        self.metadata_cache = MetadataCache(cinema_name)
 
     def scrape_movies(self, soup: BeautifulSoup) -> list[Tag]:
         movie_items = soup.find_all("a", class_="movie-item")
         movies = []
         movie_titles = set()
+        unique_movies = []
 
-        # Recorrer películas y mostrar barra de progreso
-        for movie in tqdm(
-            movie_items, desc="Scraping CineColombia movies", unit="movie"
-        ):
+        for movie in movie_items:
             title = movie.find("h2", class_="movie-item__title").get_text().strip()
 
             if title not in movie_titles:
-                raw_movies = self.get_raw_movies(movie, title)
-                raw_movies_details = self.get_raw_movies_details(movie)
+                movie_titles.add(title)
+                unique_movies.append((movie, title))
 
-                if not raw_movies and not raw_movies_details:
-                    continue
+        # Solo se descargan las páginas de detalle de películas nuevas o con datos vencidos
+        details_urls = [self.get_movie_details_url(movie) for movie, _ in unique_movies]
+        movies_details = self.metadata_cache.resolve(details_urls, self.scrape_movies_details)
 
-                raw_movie_data = {**raw_movies, **raw_movies_details}
-                movies.append(raw_movie_data)
+        # Recorrer películas y mostrar barra de progreso
+        for (movie, title), raw_movies_details in tqdm(
+            zip(unique_movies, movies_details),
+            total=len(unique_movies),
+            desc="Scraping CineColombia movies",
+            unit="movie",
+        ):
+            if not raw_movies_details:
+                # Sin detalle (descarga fallida o página vacía) se guarda con los datos de la cartelera
+                print(f"No se pudo obtener el detalle de la película: {title}")
+                raw_movies_details = {}
+
+            raw_movies = self.get_raw_movies(movie, title)
+
+            if not raw_movies and not raw_movies_details:
+                continue
+
+            raw_movie_data = {**raw_movies, **raw_movies_details}
+            movies.append(raw_movie_data)
 
         return movies
 
@@ -63,12 +88,12 @@ class CineColombiaMoviesScraper(BeautifulSoupMoviesScraper):
             "classification": self.format_classisfication(raw_movie["classification"]),
             "cinema_name": raw_movie["cinema_name"],
             "genres": self.format_genres(raw_movie["genres"]),
-            "original_title": raw_movie["original_title"],
-            "country_origin": raw_movie["country_origin"],
-            "director": raw_movie["director"],
-            "actors": raw_movie["actors"],
-            "language": raw_movie["language"],
-            "synopsis": raw_movie["synopsis"],
+            "original_title": raw_movie.get("original_title", ""),
+            "country_origin": raw_movie.get("country_origin", ""),
+            "director": raw_movie.get("director", ""),
+            "actors": raw_movie.get("actors", ""),
+            "language": raw_movie.get("language", ""),
+            "synopsis": raw_movie.get("synopsis", ""),
             "image_url": raw_movie["image_url"],
         }
 
@@ -115,15 +140,21 @@ class CineColombiaMoviesScraper(BeautifulSoupMoviesScraper):
 
         return movie_data
 
-    def get_raw_movies_details(self, movie: Tag) -> dict | None:
-        link = movie["href"]
-        url = f"https://www.cinecolombia.com{link}"
+    def scrape_movies_details(self, details_urls: list[str]) -> list[dict | None]:
+        # Descargar todas las páginas de detalle al mismo tiempo
+        responses = self.bs_driver.fetch_all(details_urls, self.fetch_concurrency)
 
-        response = self.bs_driver.get_http_response(url)
-        if not response:
-            return None
+        return [
+            self.get_raw_movies_details(response) if response else None
+            for response in responses
+        ]
 
-        soup = BeautifulSoup(response.text, "html.parser")
+    def get_movie_details_url(self, movie: Tag) -> str:
+        link = movie["href"]
+        return f"https://www.cinecolombia.com{link}"
+
+    def get_raw_movies_details(self, response: requests.Response) -> dict:
+        soup = self.html_parser.parse(response.text, self.details_strainer)
         details = soup.find_all("div", class_="movie-details__block")
         movie_info = {}
 
@@ -185,20 +216,6 @@ class CineColombiaShowtimesScraper(SeleniumShowtimesScraper):
             print(f"Error al cargar elementos de películas: {e}")
             return None
 
-        try:
-            cookie_modal = self.selenium_driver.wait.until(
-                EC.presence_of_element_located((By.CLASS_NAME, "cookie-modal"))
-            )
-            cookies_button = cookie_modal.find_element(By.TAG_NAME, "button")
-
-            if cookies_button:
-                cookies_button.click()
-
-        except TimeoutException:
-            print("No hay ventana de cookies")
-        except NoSuchElementException:
-            print("No hay botón de cookies en la ventana de cookies")
-
         for movie in movies:
             try:
                 movie_link = movie.get_attribute("href")
@@ -242,41 +259,70 @@ class CineColombiaShowtimesScraper(SeleniumShowtimesScraper):
 
         return None
 
-    def get_raw_showtimes(self, links: list[str]) -> list[dict] | None:
-        showtimes = []
+    def accept_cookies(self, selenium_driver: SeleniumDriver) -> None:
+        try:
+            cookie_modal = selenium_driver.wait.until(
+                EC.presence_of_element_located((By.CLASS_NAME, "cookie-modal"))
+            )
+            cookies_button = cookie_modal.find_element(By.TAG_NAME, "button")
 
-        for link in tqdm(
-            links, desc="Scraping CineColombia showtimes", unit="showtime"
-        ):
-            if link is None:
-                print("Link no existe")
-                continue
+            if cookies_button:
+                cookies_button.click()
 
-            try:
-                self.selenium_driver.get(link)
+        except TimeoutException:
+            print("No hay ventana de cookies")
+        except NoSuchElementException:
+            print("No hay botón de cookies en la ventana de cookies")
 
-                rooms = self.selenium_driver.wait.until(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, "collapsible"))
-                )
+    def setup_crawl_driver(self, selenium_driver: SeleniumDriver) -> None:
+        selenium_driver.get(self.url)
+        self.accept_cookies(selenium_driver)
 
-                raw_showtimes_details = self.get_raw_showtimes_details(rooms, link)
+    def get_raw_showtimes(self, links: list[str]) -> list[dict] | None:
+        showtimes = []
+        valid_links = [link for link in links if link is not None]
+
+        if len(valid_links) != len(links):
+            print("Link no existe")
+
+        raw_showtimes = crawl_links(
+            valid_links,
+            self.get_raw_showtime,
+            self.crawl_workers,
+            self.page_load_timeout,
+            setup=self.setup_crawl_driver,
+            desc="Scraping CineColombia showtimes",
+            unit="showtime",
+            driver_options=self.get_driver_options(),
+        )
+
+        for raw_showtimes_details in raw_showtimes:
+            if raw_showtimes_details:
+                showtimes.extend(raw_showtimes_details)
 
-                if raw_showtimes_details:
-                    showtimes.extend(raw_showtimes_details)
+        return showtimes
 
-            except WebDriverException:
-                print(f"No hay funciones en la página: {link}")
-                continue
+    def get_raw_showtime(self, selenium_driver: SeleniumDriver, link: str) -> list[dict] | None:
+        try:
+            selenium_driver.get(link)
 
-        return showtimes
+            rooms = selenium_driver.wait.until(
+                EC.presence_of_all_elements_located((By.CLASS_NAME, "collapsible"))
+            )
+
+            return self.get_raw_showtimes_details(selenium_driver, rooms, link)
+
+        except WebDriverException:
+            print(f"No hay funciones en la página: {link}")
+            return None
 
     def get_raw_showtimes_details(
-        self, rooms: list[WebElement], url: str
+        self, selenium_driver: SeleniumDriver, rooms: list[WebElement], url: str
     ) -> list[dict]:
         showtimes = []
 
         try:
-            movie_title = self.selenium_driver.find_element_by_class(
+            movie_title = selenium_driver.find_element_by_class(
                 "ezstring-field"
             ).text
         except NoSuchElementException:
@@ -295,7 +341,7 @@ class CineColombiaShowtimesScraper(SeleniumShowtimesScraper):
                 continue
 
             try:
-                schedules_elements = self.selenium_driver.wait.until(
+                schedules_elements = selenium_driver.wait.until(
                     EC.presence_of_all_elements_located(
                         (
                             By.CLASS_NAME,
@@ -1,5 +1,7 @@
-from bs4 import BeautifulSoup
-from movies.scraping.scraper import Scraper, SeleniumDriver, SeleniumMoviesScraper, SeleniumShowtimesScraper
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+from movies.scraping.metadata_cache import MetadataCache
+from movies.scraping.scraper import Scraper, SeleniumDriver, SeleniumMoviesScraper, SeleniumShowtimesScraper, crawl_links, find_in_html, html_text
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, WebDriverException
 from selenium.webdriver.common.by import By
@@ -7,6 +9,7 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from tqdm import tqdm
+from urllib.parse import urljoin
 import datetime
 import requests
 import time
@@ -25,6 +28,7 @@ class CineMarkMoviesScraper(SeleniumMoviesScraper):
         super().__init__()
         self.cinema_name = cinema_name
         self.url = url
+        self.metadata_cache = MetadataCache(cinema_name)
 
     def scrape_movies(self):
         movies_data = self.selenium_driver.wait.until(
@@ -91,9 +95,10 @@ class CineMarkMoviesScraper(SeleniumMoviesScraper):
             except WebDriverException:
                 continue
 
-        for link in tqdm(movies_links, desc="Scraping CineMark movies", unit="movie"):
-            raw_movie_details = self.get_raw_movie_details(link)
+        # Solo se abren las páginas de detalle de películas nuevas o con datos vencidos
+        movies_details = self.metadata_cache.resolve(movies_links, self.crawl_movies_details)
 
+        for raw_movie_details in movies_details:
             if not raw_movie_details:
                 continue
 
@@ -104,6 +109,17 @@ class CineMarkMoviesScraper(SeleniumMoviesScraper):
 
         return raw_movies
     
+    def crawl_movies_details(self, movies_links: list[str]) -> list[dict | None]:
+        return crawl_links(
+            movies_links,
+            self.get_raw_movie_details,
+            self.crawl_workers,
+            self.page_load_timeout,
+            desc="Scraping CineMark movies",
+            unit="movie",
+            driver_options=self.get_driver_options(),
+        )
+
     def get_raw_movie(self, movie: WebElement, raw_movies_set: set):
         try:
             raw_movie = {}
@@ -128,11 +144,11 @@ class CineMarkMoviesScraper(SeleniumMoviesScraper):
         except WebDriverException:
             return None
 
-    def get_raw_movie_details(self, link: str):
+    def get_raw_movie_details(self, selenium_driver: SeleniumDriver, link: str):
         try:
             raw_movie_details = {}
-            self.selenium_driver.get(link)
-            details_container = self.selenium_driver.wait.until(
+            selenium_driver.get(link)
+            details_container = selenium_driver.wait.until(
                 EC.presence_of_element_located((By.CLASS_NAME, 'detailMovie__container'))
             )
             titulo_original = details_container.find_element(By.XPATH, "//h4[text()='título original']/following-sibling::p").text
@@ -195,13 +211,24 @@ class CineMarkShowtimesScraper(SeleniumShowtimesScraper):
     def scrape_showtimes(self):
         raw_showtimes = []
 
-        movies_data = self.selenium_driver.wait.until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, 'section-detail__schedule'))
-        )
+        if self.snapshot_mode:
+            soup = self.selenium_driver.snapshot(
+                (By.CLASS_NAME, 'section-detail__schedule'),
+                self.html_parser,
+                SoupStrainer(class_='section-detail__schedule'),
+            )
+            movies_data = soup.select('.section-detail__schedule')
+            get_schedules = self.get_schedules_from_html
+
+        else:
+            movies_data = self.selenium_driver.wait.until(
+                EC.presence_of_all_elements_located((By.CLASS_NAME, 'section-detail__schedule'))
+            )
+            get_schedules = self.get_schedules
             
         for movie in tqdm(movies_data, desc="Scraping CineMark showtimes", unit="showtime"):
             try:
-                showtime = self.get_schedules(movie)
+                showtime = get_schedules(movie)
 
                 if not showtime:
                     continue
@@ -268,6 +295,33 @@ class CineMarkShowtimesScraper(SeleniumShowtimesScraper):
 
         return showtimes
 
+    def get_schedules_from_html(self, movie: Tag):
+        # Los mismos datos que get_schedules, leídos del snapshot de la página
+        showtimes = []
+        title = html_text(find_in_html(movie, '.section-detail__title'))
+        container = movie.select('.theater-detail__container--principal__co')
+        url = urljoin(self.url, find_in_html(movie, 'a').get('href', ''))
+
+        for contain in container:
+            formats = [html_text(format_element) for format_element in contain.select('.formats__item')]
+            movie_format = ' '.join(formats)
+            schedules = [html_text(schedule_element) for schedule_element in contain.select('.sessions__button--runtime')]
+
+            for schedule in schedules:
+                showtime = {
+                    'title': title,
+                    'cinema_name': self.cinema_name,
+                    'room': 'Pacific Mall',
+                    'format': movie_format,
+                    'date': '',
+                    'schedule': schedule,
+                    'url': url
+                }
+
+                showtimes.append(showtime)
+
+        return showtimes
+
     def format_title(self, title: str) -> str:
         return title.title()
     
@@ -1,16 +1,21 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
 from movies.scraping.scraper import (
     Scraper,
     SeleniumMoviesScraper,
     SeleniumShowtimesScraper,
     BeautifulSoupMoviesScraper,
+    find_in_html,
+    html_text,
 )
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from tqdm import tqdm
+from urllib.parse import urljoin
 import datetime
+import requests
 
 
 class CinepolisScraper(Scraper):
@@ -28,19 +33,49 @@ class CinepolisMoviesScraper(SeleniumMoviesScraper, BeautifulSoupMoviesScraper):
         BeautifulSoupMoviesScraper.__init__(self)
         self.cinema_name = cinema_name
         self.url = url
+        # El sitio se arma con Angular después del DOM: esperar la carga completa
+        self.page_load_strategy = "normal"
+        # Las sinopsis casi no cambian: se sirven desde la caché durante un día
+        self.bs_driver.cache_max_age = 24 * 60 * 60
+        # Solo se parsean las películas de la cartelera y el párrafo de la sinopsis
+        self.movies_strainer = SoupStrainer(class_="tituloPelicula")
+        self.synopsis_strainer = SoupStrainer(
+            "p", id="ContentPlaceHolder1_ctl_sinopsis_ctl_sinopsis"
+        )
 
     def scrape_movies(self) -> list[dict] | None:
+        raw_movies = self.extract_raw_movies()
+
+        if not raw_movies:
+            print("No se encontraron datos de las peliculas")
+            return None
+
+        self.add_synopses(raw_movies)
+
+        return raw_movies
+
+    def extract_raw_movies(self) -> list[dict]:
         raw_movies = []
         movies_set = set()
-        movies_data = self.selenium_driver.wait.until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, "tituloPelicula"))
-        )
+
+        if self.snapshot_mode:
+            soup = self.selenium_driver.snapshot(
+                (By.CLASS_NAME, "tituloPelicula"), self.html_parser, self.movies_strainer
+            )
+            movies_data = soup.select(".tituloPelicula")
+            get_raw_movie = self.get_raw_movies_from_html
+
+        else:
+            movies_data = self.selenium_driver.wait.until(
+                EC.presence_of_all_elements_located((By.CLASS_NAME, "tituloPelicula"))
+            )
+            get_raw_movie = self.get_raw_movies
 
         for movie_element in tqdm(
             movies_data, desc="Scraping Cinepolis movies", unit="movie"
         ):
             try:
-                raw_movie = self.get_raw_movies(movie_element, movies_set)
+                raw_movie = get_raw_movie(movie_element, movies_set)
 
                 if raw_movie:
                     raw_movies.append(raw_movie)
@@ -48,10 +83,6 @@ class CinepolisMoviesScraper(SeleniumMoviesScraper, BeautifulSoupMoviesScraper):
             except NoSuchElementException:
                 continue
 
-        if not raw_movies:
-            print("No se encontraron datos de las peliculas")
-            return None
-
         return raw_movies
 
     def format_movie(self, raw_movie: dict) -> dict | None:
@@ -73,24 +104,49 @@ class CinepolisMoviesScraper(SeleniumMoviesScraper, BeautifulSoupMoviesScraper):
         return formatted_movie
 
     def get_raw_movies(self, movie_element: WebElement, movies_set: set) -> dict | None:
-        movies = {}
-
         # Obtener los datos
-        title = movie_element.find_element(
-            By.CLASS_NAME, "datalayer-movie"
-        ).text.strip()
-        duration = movie_element.find_element(By.CLASS_NAME, "duracion").text.strip()
-        classification = movie_element.find_element(
-            By.CLASS_NAME, "clasificacion"
-        ).text.strip()
+        title_element = movie_element.find_element(By.CLASS_NAME, "datalayer-movie")
         movie_details = movie_element.find_element(By.CLASS_NAME, "data-layer")
-        genres = movie_details.get_attribute("data-genero")
-        director = movie_details.get_attribute("data-director")
-        actors = movie_details.get_attribute("data-actor")
-        original_title = movie_details.get_attribute("data-titulooriginal")
-        image_url = movie_element.find_element(By.TAG_NAME, "img").get_attribute("src")
-        synopsis_element = movie_element.find_element(By.CLASS_NAME, "datalayer-movie")
-        element_id = synopsis_element.get_attribute("id")
+
+        fields = {
+            "title": title_element.text.strip(),
+            "duration": movie_element.find_element(By.CLASS_NAME, "duracion").text.strip(),
+            "classification": movie_element.find_element(
+                By.CLASS_NAME, "clasificacion"
+            ).text.strip(),
+            "genres": movie_details.get_attribute("data-genero"),
+            "director": movie_details.get_attribute("data-director"),
+            "actors": movie_details.get_attribute("data-actor"),
+            "original_title": movie_details.get_attribute("data-titulooriginal"),
+            "image_url": movie_element.find_element(By.TAG_NAME, "img").get_attribute("src"),
+            "element_id": title_element.get_attribute("id"),
+        }
+
+        return self.build_raw_movie(fields, movies_set)
+
+    def get_raw_movies_from_html(self, movie: Tag, movies_set: set) -> dict | None:
+        # Los mismos datos que get_raw_movies, leídos del snapshot de la página
+        title_element = find_in_html(movie, ".datalayer-movie")
+        movie_details = find_in_html(movie, ".data-layer")
+
+        fields = {
+            "title": html_text(title_element),
+            "duration": html_text(find_in_html(movie, ".duracion")),
+            "classification": html_text(find_in_html(movie, ".clasificacion")),
+            "genres": movie_details.get("data-genero", ""),
+            "director": movie_details.get("data-director", ""),
+            "actors": movie_details.get("data-actor", ""),
+            "original_title": movie_details.get("data-titulooriginal", ""),
+            "image_url": urljoin(self.url, find_in_html(movie, "img").get("src", "")),
+            "element_id": title_element.get("id", ""),
+        }
+
+        return self.build_raw_movie(fields, movies_set)
+
+    def build_raw_movie(self, fields: dict, movies_set: set) -> dict | None:
+        movies = {}
+        title = fields["title"]
+        element_id = fields["element_id"]
 
         # Obtener el url donde está la sinopsis
         synopsis_url = None
@@ -103,9 +159,8 @@ class CinepolisMoviesScraper(SeleniumMoviesScraper, BeautifulSoupMoviesScraper):
             synopsis_url = element_id.split("cinepolis-vip-limonar-cali-")[-1].strip()
 
         if synopsis_url:
-            synopsis = self.get_synopsis(
-                f"https://cinepolis.com.co/pelicula/{synopsis_url}"
-            )
+            # La sinopsis se descarga después, junto con la de las demás películas
+            synopsis_url = f"https://cinepolis.com.co/pelicula/{synopsis_url}"
 
         if title in movies_set:
             return None
@@ -114,15 +169,16 @@ class CinepolisMoviesScraper(SeleniumMoviesScraper, BeautifulSoupMoviesScraper):
 
         movies["title"] = title
         movies["cinema_name"] = self.cinema_name
-        movies["genres"] = genres
-        movies["classification"] = classification
-        movies["duration"] = duration
-        movies["image_url"] = image_url
+        movies["genres"] = fields["genres"]
+        movies["classification"] = fields["classification"]
+        movies["duration"] = fields["duration"]
+        movies["image_url"] = fields["image_url"]
         movies["synopsis"] = synopsis
-        movies["original_title"] = original_title
+        movies["synopsis_url"] = synopsis_url
+        movies["original_title"] = fields["original_title"]
         movies["country_origin"] = ""
-        movies["director"] = director
-        movies["actors"] = actors
+        movies["director"] = fields["director"]
+        movies["actors"] = fields["actors"]
         movies["language"] = ""
 
         return movies
@@ -148,10 +204,24 @@ class CinepolisMoviesScraper(SeleniumMoviesScraper, BeautifulSoupMoviesScraper):
 
         return classification
 
-    def get_synopsis(self, url: str) -> str:
-        response = self.bs_driver.get_http_response(url)
+    def add_synopses(self, raw_movies: list[dict]) -> None:
+        movies_with_synopsis = [movie for movie in raw_movies if movie["synopsis_url"]]
+        responses = self.bs_driver.fetch_all(
+            [movie["synopsis_url"] for movie in movies_with_synopsis],
+            self.fetch_concurrency,
+        )
+
+        for movie, response in zip(movies_with_synopsis, responses):
+            movie["synopsis"] = self.get_synopsis(response)
+
+        for movie in raw_movies:
+            del movie["synopsis_url"]
+
+        self.report_http_stats()
+
+    def get_synopsis(self, response: requests.Response | None) -> str:
         if response:
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self.html_parser.parse(response.text, self.synopsis_strainer)
             synopsis = soup.find(
                 "p", id="ContentPlaceHolder1_ctl_sinopsis_ctl_sinopsis"
             )
@@ -161,6 +231,8 @@ class CinepolisMoviesScraper(SeleniumMoviesScraper, BeautifulSoupMoviesScraper):
 
             return synopsis.text
 
+        return ""
+
     def format_actors(self, actors: str):
         actors = ", ".join(
             actors.replace('"', "").replace("[", "").replace("]", "").split(", ")
@@ -177,6 +249,8 @@ class CinepolisShowtimesScraper(SeleniumShowtimesScraper):
         super().__init__()
         self.cinema_name = cinema_name
         self.url = url
+        # El sitio se arma con Angular después del DOM: esperar la carga completa
+        self.page_load_strategy = "normal"
 
     def scrape_showtimes(self) -> list[dict] | None:
         raw_showtimes = []
@@ -0,0 +1,142 @@
+from pathlib import Path
+from requests.structures import CaseInsensitiveDict
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import requests
+
+
+class HttpCache:
+    """
+    Caché en disco de las páginas descargadas por BeautifulSoupDriver.
+    Guarda el cuerpo de cada respuesta junto con sus validadores (ETag y
+    Last-Modified) para repetir la petición como GET condicional. Cuando el
+    tamaño total supera `max_size_mb` se borran las entradas usadas hace más tiempo.
+    """
+
+    def __init__(self, directory: str | Path, max_size_mb: int = 100) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size_mb * 1024 * 1024
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    def get_paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def get(self, url: str) -> dict | None:
+        meta_path, body_path = self.get_paths(url)
+
+        try:
+            with open(meta_path, encoding="utf-8") as meta_file:
+                entry = json.load(meta_file)
+
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if not body_path.exists():
+            return None
+
+        return entry
+
+    def is_fresh(self, entry: dict, max_age: int) -> bool:
+        return max_age > 0 and time.time() - entry["stored_at"] < max_age
+
+    def get_conditional_headers(self, entry: dict | None) -> dict:
+        headers = {}
+
+        if not entry:
+            return headers
+
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        return headers
+
+    def build_response(self, url: str, entry: dict) -> requests.Response | None:
+        _, body_path = self.get_paths(url)
+
+        try:
+            body = body_path.read_bytes()
+            # Marcar la entrada como usada recientemente para la expulsión
+            os.utime(body_path)
+
+        except FileNotFoundError:
+            return None
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.encoding = entry["encoding"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+
+        return response
+
+    def store(self, url: str, response: requests.Response) -> None:
+        meta_path, body_path = self.get_paths(url)
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "encoding": response.encoding or response.apparent_encoding,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "")},
+            "stored_at": time.time(),
+        }
+
+        self.write_file(body_path, response.content)
+        self.write_file(meta_path, json.dumps(entry).encode("utf-8"))
+        self.evict()
+
+    def refresh(self, url: str, entry: dict) -> None:
+        # El servidor respondió 304: el cuerpo guardado sigue siendo válido
+        meta_path, _ = self.get_paths(url)
+        entry["stored_at"] = time.time()
+        self.write_file(meta_path, json.dumps(entry).encode("utf-8"))
+
+    def write_file(self, path: Path, content: bytes) -> None:
+        # Escribir en un archivo temporal y reemplazar para no dejar entradas a medias
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as temp_file:
+            temp_file.write(content)
+
+        os.replace(temp_file.name, path)
+
+    def evict(self) -> None:
+        entries = []
+        total_size = 0
+
+        for body_path in self.directory.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, body_path))
+            total_size += stat.st_size
+
+        if total_size <= self.max_size:
+            return
+
+        # Borrar primero las entradas usadas hace más tiempo
+        for _, size, body_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            total_size -= size
+
+    def record(self, result: str) -> None:
+        with self.lock:
+            self.stats[result] += 1
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return dict(self.stats)
@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+from movies.models import MovieMetadata
+import datetime
+
+
+class MetadataCache:
+    """
+    Guarda en la base de datos los datos de detalle de cada película (sinopsis,
+    director, reparto...) por cine y enlace, para que los scrapers solo abran las
+    páginas de detalle de películas nuevas o cuyos datos tienen más de `ttl_days`.
+    """
+
+    def __init__(self, cinema_name: str, ttl_days: int | None = None) -> None:
+        self.cinema_name = cinema_name
+        self.ttl = datetime.timedelta(
+            days=settings.SCRAPING_METADATA_TTL_DAYS if ttl_days is None else ttl_days
+        )
+
+    def get_many(self, keys: list[str]) -> dict[str, dict]:
+        try:
+            entries = MovieMetadata.objects.filter(
+                cinema_name=self.cinema_name,
+                key__in=keys,
+                updated_at__gte=timezone.now() - self.ttl,
+            ).values_list("key", "data")
+
+            return dict(entries)
+
+        except DatabaseError as e:
+            print(f"No se pudo leer la caché de metadatos de {self.cinema_name}: {e}")
+            return {}
+
+    def set_many(self, entries: dict[str, dict]) -> None:
+        if not entries:
+            return
+
+        try:
+            MovieMetadata.objects.bulk_create(
+                [
+                    MovieMetadata(cinema_name=self.cinema_name, key=key, data=data)
+                    for key, data in entries.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["cinema_name", "key"],
+                update_fields=["data", "updated_at"],
+            )
+
+        except DatabaseError as e:
+            print(f"No se pudo guardar la caché de metadatos de {self.cinema_name}: {e}")
+
+    def resolve(self, keys: list[str], scrape_missing) -> list[dict | None]:
+        """
+        Devuelve los datos de cada clave en el mismo orden de `keys`. Solo las
+        claves sin datos vigentes se pasan a `scrape_missing(keys)`, que debe
+        devolver una lista alineada con ellas (None si no se pudo scrapear). Los
+        datos vacíos ({}) se devuelven tal cual para que el scraper decida qué hacer.
+        """
+        cached = self.get_many(keys)
+        missing = list(dict.fromkeys(key for key in keys if key not in cached))
+        scraped = scrape_missing(missing) if missing else []
+
+        scraped_by_key = dict(zip(missing, scraped))
+        # Un detalle vacío no se guarda: se vuelve a intentar en la próxima ejecución
+        self.set_many({key: data for key, data in scraped_by_key.items() if data})
+
+        print(
+            f"Metadatos de {self.cinema_name}: {len(cached)} en caché, "
+            f"{len(missing)} páginas de detalle scrapeadas"
+        )
+
+        return [cached[key] if key in cached else scraped_by_key.get(key) for key in keys]
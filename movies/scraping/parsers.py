@@ -0,0 +1,34 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+
+    LXML_AVAILABLE = True
+
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+PARSER_BACKENDS = ["lxml", "html.parser"]
+
+
+class HtmlParser:
+    """
+    Construye el árbol de BeautifulSoup con el backend elegido: "lxml" (en C, más
+    rápido), "html.parser" (Python puro) o "auto", que usa lxml si está instalado.
+    Con `only` se parsean solo las etiquetas que le interesan al scraper
+    (SoupStrainer) en lugar de la página completa.
+    """
+
+    def __init__(self, backend: str = "auto") -> None:
+        if backend == "auto":
+            backend = "lxml" if LXML_AVAILABLE else "html.parser"
+
+        elif backend == "lxml" and not LXML_AVAILABLE:
+            print("lxml no está instalado, se usa html.parser")
+            backend = "html.parser"
+
+        self.backend = backend
+
+    def parse(self, markup: str | bytes, only: SoupStrainer | None = None) -> BeautifulSoup:
+        return BeautifulSoup(markup, self.backend, parse_only=only)
@@ -1,9 +1,11 @@
 from bs4 import BeautifulSoup
+from movies.scraping.metadata_cache import MetadataCache
 from movies.scraping.scraper import (
     Scraper,
     SeleniumDriver,
     SeleniumMoviesScraper,
     SeleniumShowtimesScraper,
+    crawl_links,
 )
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, WebDriverException
@@ -32,9 +34,12 @@ class RoyalFilmsMoviesScraper(SeleniumMoviesScraper):
         super().__init__()
         self.cinema_name = cinema_name
         self.url = url
+        # El sitio se arma con Angular después del DOM: esperar la carga completa
+        self.page_load_strategy = "normal"
+        self.metadata_cache = MetadataCache(cinema_name)
 
     def scrape_movies(self):
-        self.select_city()
+        self.select_city(self.selenium_driver)
         movies_data = self.selenium_driver.wait.until(
             EC.presence_of_all_elements_located(
                 (By.CLASS_NAME, "prs_upcom_movie_box_wrapper")
@@ -67,9 +72,9 @@ class RoyalFilmsMoviesScraper(SeleniumMoviesScraper):
 
         return formatted_movie
 
-    def select_city(self):
+    def select_city(self, selenium_driver: SeleniumDriver):
         try:
-            city_card = self.selenium_driver.wait.until(
+            city_card = selenium_driver.wait.until(
                 EC.presence_of_element_located((By.CLASS_NAME, "card"))
             )
 
@@ -93,15 +98,21 @@ class RoyalFilmsMoviesScraper(SeleniumMoviesScraper):
             print(e)
             print("No se encontro la ciudad")
 
+    def setup_crawl_driver(self, selenium_driver: SeleniumDriver) -> None:
+        selenium_driver.get(self.url)
+        self.select_city(selenium_driver)
+
     def get_movies_links(self, movies_data: list[WebElement]):
-        movies_links = set()
+        visited_movies_links = set()
+        movies_links = []
 
         for movie in movies_data:
             try:
                 link = movie.find_element(By.TAG_NAME, "a").get_attribute("href")
 
-                if link not in movies_links:
-                    movies_links.add(link)
+                if link not in visited_movies_links:
+                    visited_movies_links.add(link)
+                    movies_links.append(link)
 
             except WebDriverException:
                 continue
@@ -109,29 +120,28 @@ class RoyalFilmsMoviesScraper(SeleniumMoviesScraper):
         return movies_links
 
     def get_raw_movies(self, movies_links: list[str]) -> list[dict]:
-        raw_movies = []
-
-        for movie_link in tqdm(
-            movies_links, desc="Scraping RoyalFilms movies", unit="movie"
-        ):
-            try:
-                raw_movie = self.get_raw_movie(movie_link)
-
-                if not raw_movie:
-                    continue
-
-                raw_movies.append(raw_movie)
-
-            except WebDriverException:
-                continue
-
-        return raw_movies
+        # Solo se abren las páginas de películas nuevas o con datos vencidos
+        raw_movies = self.metadata_cache.resolve(movies_links, self.crawl_movies)
+
+        return [raw_movie for raw_movie in raw_movies if raw_movie]
+
+    def crawl_movies(self, movies_links: list[str]) -> list[dict | None]:
+        return crawl_links(
+            movies_links,
+            self.get_raw_movie,
+            self.crawl_workers,
+            self.page_load_timeout,
+            setup=self.setup_crawl_driver,
+            desc="Scraping RoyalFilms movies",
+            unit="movie",
+            driver_options=self.get_driver_options(),
+        )
 
-    def get_raw_movie(self, movie_link: str) -> dict | None:
+    def get_raw_movie(self, selenium_driver: SeleniumDriver, movie_link: str) -> dict | None:
         try:
-            self.selenium_driver.get(movie_link)
+            selenium_driver.get(movie_link)
 
-            info_card = self.selenium_driver.wait.until(
+            info_card = selenium_driver.wait.until(
                 EC.presence_of_element_located((By.CLASS_NAME, "st_video_slide_sec"))
             )
 
@@ -141,13 +151,13 @@ class RoyalFilmsMoviesScraper(SeleniumMoviesScraper):
             language = info_card_text[1]
             genres = info_card_text[2]
 
-            duration = self.selenium_driver.wait.until(
+            duration = selenium_driver.wait.until(
                 EC.presence_of_element_located(
                     (By.CLASS_NAME, "st_video_slide_social_right.float_left")
                 )
             ).text
 
-            details_card = self.selenium_driver.wait.until(
+            details_card = selenium_driver.wait.until(
                 EC.presence_of_element_located((By.CLASS_NAME, "prs_syn_cont_wrapper"))
             ).text.split("\n")
 
@@ -157,7 +167,7 @@ class RoyalFilmsMoviesScraper(SeleniumMoviesScraper):
             actors = details_card[4]
             director = details_card[5]
 
-            image_container = self.selenium_driver.wait.until(
+            image_container = selenium_driver.wait.until(
                 EC.presence_of_element_located(
                     (By.CLASS_NAME, "prs_syn_img_wrapper.ng-star-inserted")
                 )
@@ -229,9 +239,11 @@ class RoyalFilmsShowtimesScraper(SeleniumShowtimesScraper):
         super().__init__()
         self.cinema_name = cinema_name
         self.url = url
+        # El sitio se arma con Angular después del DOM: esperar la carga completa
+        self.page_load_strategy = "normal"
 
     def scrape_showtimes(self) -> list[dict] | None:
-        self.select_city()
+        self.select_city(self.selenium_driver)
         movies_data = self.selenium_driver.wait.until(
             EC.presence_of_all_elements_located(
                 (By.CLASS_NAME, "prs_upcom_movie_box_wrapper")
@@ -268,9 +280,9 @@ class RoyalFilmsShowtimesScraper(SeleniumShowtimesScraper):
 
         return None
 
-    def select_city(self):
+    def select_city(self, selenium_driver: SeleniumDriver):
         try:
-            city_card = self.selenium_driver.wait.until(
+            city_card = selenium_driver.wait.until(
                 EC.presence_of_element_located((By.CLASS_NAME, "card"))
             )
 
@@ -312,34 +324,38 @@ class RoyalFilmsShowtimesScraper(SeleniumShowtimesScraper):
 
         return movies_links
 
+    def setup_crawl_driver(self, selenium_driver: SeleniumDriver) -> None:
+        selenium_driver.get(self.url)
+        self.select_city(selenium_driver)
+
     def get_raw_showtimes(self, movies_links: list[dict]) -> list[dict]:
         raw_movies = []
 
-        for movie_link in tqdm(
-            movies_links, desc="Scraping RoyalFilms showtimes", unit="showtime"
-        ):
-            if movie_link is None:
-                continue
-
-            try:
-                raw_movie = self.get_raw_showtime(movie_link)
-
-                if not raw_movie:
-                    continue
-
-                raw_movies.extend(raw_movie)
+        crawled_showtimes = crawl_links(
+            [movie_link for movie_link in movies_links if movie_link is not None],
+            self.get_raw_showtime,
+            self.crawl_workers,
+            self.page_load_timeout,
+            setup=self.setup_crawl_driver,
+            desc="Scraping RoyalFilms showtimes",
+            unit="showtime",
+            driver_options=self.get_driver_options(),
+        )
 
-            except WebDriverException:
+        for raw_movie in crawled_showtimes:
+            if not raw_movie:
                 continue
 
+            raw_movies.extend(raw_movie)
+
         return raw_movies
 
-    def get_raw_showtime(self, movie_link: str) -> list[dict] | None:
+    def get_raw_showtime(self, selenium_driver: SeleniumDriver, movie_link: str) -> list[dict] | None:
         try:
             showtimes = []
-            self.selenium_driver.get(movie_link)
+            selenium_driver.get(movie_link)
 
-            info_card = self.selenium_driver.wait.until(
+            info_card = selenium_driver.wait.until(
                 EC.presence_of_element_located((By.CLASS_NAME, "st_video_slide_sec"))
             )
 
@@ -347,7 +363,7 @@ class RoyalFilmsShowtimesScraper(SeleniumShowtimesScraper):
 
             title = info_card_text[0]
 
-            showtimes_elements = self.selenium_driver.wait.until(
+            showtimes_elements = selenium_driver.wait.until(
                 EC.presence_of_all_elements_located(
                     (
                         By.CLASS_NAME,
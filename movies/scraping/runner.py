@@ -0,0 +1,93 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from django.apps import apps
+from django.db import connections
+from movies.scraping.scraper import driver_pool
+import django
+
+
+EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+def run_scraper(scraper_class: type, method_name: str) -> tuple[list[dict] | None, str | None]:
+    """Ejecuta un scraper y captura sus errores para que no afecten a los demás"""
+    try:
+        scraper = scraper_class()
+        return getattr(scraper, method_name)(), None
+
+    except Exception as e:
+        return None, str(e)
+
+    finally:
+        # Los scrapers consultan la caché de metadatos; cerrar las conexiones de este hilo
+        connections.close_all()
+
+
+def setup_process() -> None:
+    # Con el método "spawn" (Windows, macOS) el proceso hijo arranca sin Django configurado
+    if not apps.ready:
+        django.setup()
+
+
+def run_scraper_in_process(scraper_class: type, method_name: str) -> tuple[list[dict] | None, str | None]:
+    # Los procesos del pool no ejecutan atexit, así que sus navegadores se cierran aquí
+    try:
+        return run_scraper(scraper_class, method_name)
+
+    finally:
+        stats = driver_pool.get_stats()
+        driver_pool.close()
+
+        if stats["leases"]:
+            print(
+                f"Navegadores de {scraper_class.__name__}: {stats['launches']} lanzados, "
+                f"{stats['launches_saved']} reutilizados"
+            )
+
+
+def run_scrapers(
+    scraper_classes: list[type],
+    method_name: str,
+    workers: int = 1,
+    executor: str = "thread",
+) -> list[tuple[type, list[dict] | None, str | None]]:
+    """
+    Ejecuta `method_name` (get_movies o get_showtimes) en cada scraper.
+    Con workers > 1 los scrapers corren en paralelo en un pool de hilos o procesos.
+    Los resultados se devuelven en el mismo orden de `scraper_classes`.
+    """
+    if workers <= 1:
+        results = [run_scraper(scraper_class, method_name) for scraper_class in scraper_classes]
+
+    else:
+        task = run_scraper
+        pool_options = {}
+
+        if executor == "process":
+            task = run_scraper_in_process
+            pool_options = {"initializer": setup_process}
+            # Evitar que los procesos hijos hereden conexiones abiertas a la base de datos
+            connections.close_all()
+
+        # Se envían las clases y no instancias para que el pool de procesos pueda serializarlas
+        with EXECUTORS[executor](max_workers=workers, **pool_options) as pool:
+            futures = [
+                pool.submit(task, scraper_class, method_name)
+                for scraper_class in scraper_classes
+            ]
+            results = []
+
+            for future in futures:
+                try:
+                    results.append(future.result())
+
+                except Exception as e:
+                    # Por ejemplo, un proceso del pool que termina abruptamente
+                    results.append((None, str(e)))
+
+    return [
+        (scraper_class, items, error)
+        for scraper_class, (items, error) in zip(scraper_classes, results)
+    ]
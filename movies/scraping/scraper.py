@@ -1,4 +1,10 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from movies.scraping.http_cache import HttpCache
+from movies.scraping.parsers import HtmlParser
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, WebDriverException
 from selenium.webdriver.common.by import By
@@ -6,8 +12,16 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from tqdm import tqdm
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+import asyncio
+import atexit
 import datetime
+import psutil
+import queue
 import requests
+import threading
+import time
 
 class Scraper:
     def __init__(self):
@@ -28,25 +42,167 @@ class Scraper:
         return self.cinema_name
     
 
-class BeautifulSoupDriver:
-    def __init__(self):
-        self.driver = requests
+class CountingHTTPConnectionPool(HTTPConnectionPool):
+    # Cuenta cuántas peticiones reutilizan una conexión abierta y cuántas abren una nueva
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+
+        if conn.is_connected:
+            self.connections_reused += 1
+        else:
+            self.connections_opened += 1
+
+        return conn
+
 
-    def get_http_response(self, url) -> requests.Response | None:
-        response = self.driver.get(url)
+class CountingHTTPSConnectionPool(HTTPSConnectionPool, CountingHTTPConnectionPool):
+    pass
+
+
+class BeautifulSoupDriver:
+    def __init__(
+        self,
+        pool_size: int = 10,
+        timeout: tuple[float, float] = (5, 30),
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        cache: HttpCache | None = None,
+        cache_max_age: int = 0,
+    ):
+        # (conexión, lectura) en segundos
+        self.timeout = timeout
+        # Con cache_max_age = 0 cada página en caché se revalida con un GET condicional
+        self.cache = cache
+        self.cache_max_age = cache_max_age
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                # Devolver la última respuesta para que el código de estado se valide abajo
+                raise_on_status=False,
+            ),
+        )
+        self.adapter.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+        self.driver = self.get_session()
+
+    def get_session(self) -> requests.Session:
+        # Una sesión mantiene las conexiones abiertas (keep-alive) entre páginas del mismo sitio
+        session = requests.Session()
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+
+        return session
+
+    def get_connection_stats(self) -> dict:
+        stats = {"requests": 0, "opened": 0, "reused": 0}
+        pools = self.adapter.poolmanager.pools
+
+        for key in pools.keys():
+            pool = pools[key]
+            stats["requests"] += pool.num_requests
+            stats["opened"] += pool.connections_opened
+            stats["reused"] += pool.connections_reused
+
+        return stats
+
+    def close(self):
+        self.driver.close()
+
+    def get_http_response(self, url, max_age: int | None = None) -> requests.Response | None:
+        if max_age is None:
+            max_age = self.cache_max_age
+
+        entry = self.cache.get(url) if self.cache else None
+
+        if entry and self.cache.is_fresh(entry, max_age):
+            cached_response = self.cache.build_response(url, entry)
+
+            if cached_response:
+                self.cache.record("hits")
+                return cached_response
+
+        headers = self.cache.get_conditional_headers(entry) if self.cache else {}
+        response = self.driver.get(url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and entry:
+            cached_response = self.cache.build_response(url, entry)
+
+            if cached_response:
+                self.cache.refresh(url, entry)
+                self.cache.record("revalidated")
+                return cached_response
+
+            # La entrada se borró mientras tanto: pedir la página completa
+            response = self.driver.get(url, timeout=self.timeout)
 
         if response.status_code != 200:
             raise requests.HTTPError(
                 f"Error al obtener la lista de películas. Código de estado: {response.status_code}"
             )
-        
+
+        if self.cache:
+            self.cache.store(url, response)
+            self.cache.record("misses")
+
         return response
+
+    def fetch_all(self, urls: list[str], concurrency: int = 8) -> list[requests.Response | None]:
+        """
+        Descarga todas las urls a la vez (como máximo `concurrency` simultáneas) y
+        devuelve las respuestas en el mismo orden; None si una descarga falla.
+        """
+        if not urls:
+            return []
+
+        return asyncio.run(self.fetch_all_async(urls, concurrency))
+
+    async def fetch_all_async(self, urls: list[str], concurrency: int) -> list[requests.Response | None]:
+        loop = asyncio.get_running_loop()
+
+        async def fetch(url, executor):
+            try:
+                # La sesión es bloqueante: cada descarga corre en un hilo y comparte el pool de conexiones
+                return await loop.run_in_executor(executor, self.get_http_response, url)
+
+            except requests.RequestException as e:
+                print(f"Error al descargar {url}: {e}")
+                return None
+
+        # Executor propio: el del loop tiene min(32, cpus + 4) hilos y limitaría la concurrencia pedida
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return await asyncio.gather(*(fetch(url, executor) for url in urls))
             
     
+def get_http_cache() -> HttpCache | None:
+    if not settings.SCRAPING_HTTP_CACHE_DIR:
+        return None
+
+    return HttpCache(
+        settings.SCRAPING_HTTP_CACHE_DIR, settings.SCRAPING_HTTP_CACHE_MAX_SIZE_MB
+    )
+
+
 class BeautifulSoupMoviesScraper:
     def __init__(self):
-        self.bs_driver = BeautifulSoupDriver()
+        self.bs_driver = BeautifulSoupDriver(cache=get_http_cache())
         self.movies = None
+        self.html_parser = HtmlParser()
+        # Etiquetas de la cartelera que se parsean (None = toda la página)
+        self.movies_strainer = None
+        # Páginas de detalle que se descargan al mismo tiempo
+        self.fetch_concurrency = 8
 
     def set_movies(self, movies):
         self.movies = movies
@@ -55,16 +211,32 @@ class BeautifulSoupMoviesScraper:
         return self.movies
 
     def update_movies(self) -> list[dict] | None:
-        response = self.bs_driver.get_http_response(self.url)
+        # La cartelera cambia a diario: siempre se revalida aunque el cine tenga max-age
+        response = self.bs_driver.get_http_response(self.url, max_age=0)
         
         if not response:
             return None
 
         movies = self.get_today_movies(response)
         self.set_movies(movies)
+        self.report_http_stats()
+
+    def report_http_stats(self) -> None:
+        stats = self.bs_driver.get_connection_stats()
+        print(
+            f"Conexiones HTTP de {self.cinema_name}: {stats['requests']} peticiones, "
+            f"{stats['opened']} conexiones abiertas, {stats['reused']} reutilizadas"
+        )
+
+        if self.bs_driver.cache:
+            cache_stats = self.bs_driver.cache.get_stats()
+            print(
+                f"Caché HTTP de {self.cinema_name}: {cache_stats['hits']} aciertos, "
+                f"{cache_stats['revalidated']} revalidadas (304), {cache_stats['misses']} fallos"
+            )
 
     def get_today_movies(self, response: requests.Response) -> list[dict] | None:
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = self.html_parser.parse(response.text, self.movies_strainer)
         raw_movies = self.scrape_movies(soup)
         formatted_movies = [self.format_movie(raw_movie) for raw_movie in raw_movies]
 
@@ -78,14 +250,44 @@ class BeautifulSoupMoviesScraper:
         return valid_formatted_movies
     
 
+# Patrones de URL (formato de Network.setBlockedURLs) por tipo de recurso. Los
+# scrapers solo leen texto y atributos como img src, así que no necesitan descargarlos
+BLOCKED_RESOURCE_PATTERNS = {
+    "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*youtube.com/embed*"],
+    "tracker": [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*connect.facebook.net*",
+        "*hotjar.com*",
+        "*clarity.ms*",
+    ],
+}
+
+
+def get_blocked_urls(resource_types: list[str], url_patterns: list[str]) -> list[str]:
+    blocked_urls = list(url_patterns)
+
+    for resource_type in resource_types:
+        blocked_urls.extend(BLOCKED_RESOURCE_PATTERNS[resource_type])
+
+    return blocked_urls
+
+
 class SeleniumDriver:
-    def __init__(self) -> None:
-        self.driver = self.get_driver()
+    def __init__(self, page_load_strategy: str = "normal") -> None:
+        # "eager" devuelve el control al terminar el DOM, sin esperar imágenes ni iframes
+        self.page_load_strategy = page_load_strategy
+        self.driver = self.get_driver(page_load_strategy)
         self.wait_time = 3
         self.wait = WebDriverWait(self.driver, self.wait_time)
+        self.page_loads = 0
 
     def get(self, url):
         self.driver.get(url)
+        self.page_loads += 1
 
     def find_element_by_class(self, class_name):
         return self.driver.find_element(By.CLASS_NAME, class_name)
@@ -93,9 +295,27 @@ class SeleniumDriver:
     def find_element_by_path(self, path):
         return self.driver.find_element(By.XPATH, path)
 
+    def snapshot(
+        self,
+        locator: tuple[str, str] | None = None,
+        html_parser: HtmlParser | None = None,
+        only: SoupStrainer | None = None,
+    ) -> BeautifulSoup:
+        """
+        Espera una sola vez a que aparezca `locator` y devuelve el HTML de la página
+        parseado, para extraer los datos sin una llamada al navegador por elemento.
+        """
+        if locator:
+            self.wait.until(EC.presence_of_all_elements_located(locator))
+
+        html_parser = html_parser or HtmlParser()
+
+        return html_parser.parse(self.driver.page_source, only)
+
     @staticmethod
-    def get_driver():
+    def get_driver(page_load_strategy: str = "normal"):
         options = webdriver.EdgeOptions()
+        options.page_load_strategy = page_load_strategy
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--headless")
         options.add_argument("--log-level=3")
@@ -108,15 +328,370 @@ class SeleniumDriver:
 
         return driver
 
+    def set_blocked_urls(self, blocked_urls: list[str]) -> None:
+        # El navegador cancela las peticiones que coinciden con estos patrones
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(blocked_urls)})
+
+    def get_memory_usage(self) -> int | None:
+        """
+        Memoria residente (bytes) de msedgedriver y de todos los procesos del
+        navegador que lanzó (pestañas, GPU, red...). Suma el RSS de cada proceso,
+        así que cuenta de más la memoria compartida: sirve como techo, no como medida exacta.
+        """
+        service_process = getattr(self.driver.service, "process", None)
+
+        if service_process is None:
+            return None
+
+        try:
+            driver_process = psutil.Process(service_process.pid)
+            processes = [driver_process] + driver_process.children(recursive=True)
+        except psutil.Error:
+            return None
+
+        memory_usage = 0
+
+        for process in processes:
+            try:
+                memory_usage += process.memory_info().rss
+            except psutil.Error:
+                # El proceso terminó mientras se recorría el árbol
+                pass
+
+        return memory_usage
+
+    def reset(self):
+        """Deja el navegador limpio (una pestaña, sin cookies ni almacenamiento) para reutilizarlo"""
+        handles = self.driver.window_handles
+
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+
+        self.driver.switch_to.window(handles[0])
+        self.driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        self.set_blocked_urls([])
+        self.driver.get("about:blank")
+
     def quit(self):
         self.driver.quit()
-    
+
+
+def find_in_html(tag: Tag, selector: str) -> Tag:
+    # Equivalente a find_element sobre un snapshot: lanza la misma excepción si no existe
+    element = tag.select_one(selector)
+
+    if element is None:
+        raise NoSuchElementException(f"No se encontró el elemento {selector}")
+
+    return element
+
+
+def html_text(tag: Tag) -> str:
+    # Texto con los espacios colapsados, como el .text de un WebElement
+    return " ".join(tag.get_text().split())
+
+
+# Lo que devuelve get_idle_driver cuando el pool reservó lugar para un navegador nuevo
+LAUNCH = object()
+
+
+def quit_driver(selenium_driver: SeleniumDriver) -> None:
+    try:
+        selenium_driver.quit()
+    except WebDriverException:
+        pass
+
+
+class SeleniumDriverPool:
+    """
+    Mantiene navegadores abiertos para reutilizarlos entre scrapers en lugar de
+    lanzar un Edge nuevo en cada llamada. Un navegador se cierra y se reemplaza
+    cuando supera `max_page_loads` páginas cargadas o `max_memory_mb` de memoria
+    entre el driver y todos los procesos del navegador.
+
+    Nunca hay más de `max_browsers` navegadores abiertos (en uso o libres) en el
+    proceso: acquire espera a que se libere uno hasta `acquire_timeout` segundos.
+    Cada scraper retiene su navegador mientras recorre enlaces con otros, así que
+    `max_browsers` debe ser mayor que el número de scrapers en paralelo.
+    """
+
+    def __init__(
+        self,
+        max_page_loads: int = 100,
+        max_memory_mb: int = 1024,
+        max_idle: int = 4,
+        max_browsers: int = 8,
+        acquire_timeout: float = 600,
+    ) -> None:
+        self.max_page_loads = max_page_loads
+        self.max_memory_mb = max_memory_mb
+        self.max_idle = max_idle
+        self.max_browsers = max_browsers
+        self.acquire_timeout = acquire_timeout
+        self.idle_drivers = []
+        # Navegadores abiertos, en uso o libres
+        self.open_drivers = 0
+        self.lock = threading.Lock()
+        self.available = threading.Condition(self.lock)
+        self.launches = 0
+        self.leases = 0
+        self.recycled = 0
+
+    def acquire(
+        self,
+        page_load_strategy: str = "normal",
+        blocked_urls: list[str] | None = None,
+        block: bool = True,
+    ) -> SeleniumDriver | None:
+        """
+        Devuelve un navegador libre o uno nuevo. Si ya hay `max_browsers` abiertos
+        espera a que se libere uno, o devuelve None con `block=False`.
+        """
+        selenium_driver = self.get_idle_driver(page_load_strategy, block)
+
+        if selenium_driver is None:
+            return None
+
+        if selenium_driver is LAUNCH:
+            # El navegador se lanza fuera del lock para no bloquear a otros hilos
+            try:
+                selenium_driver = SeleniumDriver(page_load_strategy)
+
+            except Exception:
+                self.free_slot()
+                raise
+
+            with self.lock:
+                self.launches += 1
+
+        if blocked_urls:
+            try:
+                selenium_driver.set_blocked_urls(blocked_urls)
+            except WebDriverException as e:
+                print(f"No se pudieron bloquear los recursos de la página: {e}")
+
+        return selenium_driver
+
+    def get_idle_driver(self, page_load_strategy: str, block: bool = True):
+        """
+        Un navegador libre con la misma estrategia de carga (se fija al lanzarlo),
+        LAUNCH si hay lugar para lanzar uno nuevo o None si no lo hay y `block` es False.
+        """
+        evicted_driver = None
+
+        with self.available:
+            deadline = time.monotonic() + self.acquire_timeout
+
+            while True:
+                for index, selenium_driver in enumerate(self.idle_drivers):
+                    if selenium_driver.page_load_strategy == page_load_strategy:
+                        self.leases += 1
+                        return self.idle_drivers.pop(index)
+
+                if self.open_drivers < self.max_browsers:
+                    self.open_drivers += 1
+                    break
+
+                if self.idle_drivers:
+                    # Un navegador libre con otra estrategia le cede su lugar al nuevo
+                    evicted_driver = self.idle_drivers.pop(0)
+                    break
+
+                if not block:
+                    return None
+
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    raise WebDriverException(
+                        f"No se liberó ninguno de los {self.max_browsers} navegadores "
+                        f"en {self.acquire_timeout} segundos"
+                    )
+
+                self.available.wait(remaining)
+
+            self.leases += 1
+
+        if evicted_driver is not None:
+            quit_driver(evicted_driver)
+
+        return LAUNCH
+
+    def free_slot(self) -> None:
+        with self.available:
+            self.open_drivers -= 1
+            self.available.notify()
+
+    def release(self, selenium_driver: SeleniumDriver | None) -> None:
+        if selenium_driver is None:
+            return
+
+        try:
+            if self.must_recycle(selenium_driver):
+                self.discard(selenium_driver, recycled=True)
+                return
+
+            selenium_driver.reset()
+
+        except WebDriverException:
+            self.discard(selenium_driver)
+            return
+
+        with self.available:
+            if len(self.idle_drivers) < self.max_idle:
+                self.idle_drivers.append(selenium_driver)
+                # Puede servirle a un hilo que espera ese tipo de navegador, o cederle su lugar
+                self.available.notify()
+                return
+
+        self.discard(selenium_driver)
+
+    def must_recycle(self, selenium_driver: SeleniumDriver) -> bool:
+        if selenium_driver.page_loads >= self.max_page_loads:
+            return True
+
+        memory_usage = selenium_driver.get_memory_usage()
+
+        return memory_usage is not None and memory_usage > self.max_memory_mb * 1024 * 1024
+
+    def discard(self, selenium_driver: SeleniumDriver, recycled: bool = False) -> None:
+        if recycled:
+            with self.lock:
+                self.recycled += 1
+
+        quit_driver(selenium_driver)
+        self.free_slot()
+
+    def close(self) -> None:
+        with self.lock:
+            idle_drivers = self.idle_drivers
+            self.idle_drivers = []
+
+        for selenium_driver in idle_drivers:
+            self.discard(selenium_driver)
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "launches": self.launches,
+                "leases": self.leases,
+                "launches_saved": self.leases - self.launches,
+                "recycled": self.recycled,
+            }
+
+
+# Pool compartido por todos los scrapers de Selenium del proceso
+driver_pool = SeleniumDriverPool(max_browsers=settings.SCRAPING_MAX_BROWSERS)
+atexit.register(driver_pool.close)
+
+
+def crawl_links(
+    links: list[str],
+    crawl_link,
+    workers: int = 3,
+    page_load_timeout: int = 30,
+    setup=None,
+    desc: str | None = None,
+    unit: str = "it",
+    driver_options: dict | None = None,
+) -> list:
+    """
+    Reparte `links` entre `workers` navegadores del pool y llama a
+    `crawl_link(selenium_driver, link)` con cada uno. `setup(selenium_driver)` se
+    ejecuta una vez por navegador antes de empezar (cookies, selección de ciudad...).
+    `driver_options` se pasa a driver_pool.acquire (estrategia de carga, recursos bloqueados).
+
+    Los resultados se devuelven en el mismo orden de `links`; un enlace que falla
+    queda como None. `page_load_timeout` acota cada carga de página y cada script,
+    no la llamada completa a `crawl_link` (sus esperas tienen su propio límite).
+
+    Solo el primer navegador espera a que el pool tenga lugar; los demás se abren
+    si lo hay y, si no, el primero recorre los enlaces que les tocaban.
+    """
+    results = [None] * len(links)
+    pending = queue.Queue()
+
+    for index in range(len(links)):
+        pending.put(index)
+
+    progress = tqdm(total=len(links), desc=desc, unit=unit)
+
+    def worker(block: bool):
+        try:
+            selenium_driver = driver_pool.acquire(**(driver_options or {}), block=block)
+        except WebDriverException as e:
+            print(f"No se pudo abrir un navegador para el scraping: {e}")
+            return
+
+        if selenium_driver is None:
+            return
+
+        try:
+            selenium_driver.driver.set_page_load_timeout(page_load_timeout)
+            selenium_driver.driver.set_script_timeout(page_load_timeout)
+
+            if setup:
+                setup(selenium_driver)
+
+            while True:
+                try:
+                    index = pending.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    results[index] = crawl_link(selenium_driver, links[index])
+                except WebDriverException as e:
+                    print(f"Error al cargar la página {links[index]}: {e}")
+
+                progress.update()
+
+        except WebDriverException as e:
+            print(f"Error al preparar el navegador para el scraping: {e}")
+
+        finally:
+            try:
+                selenium_driver.driver.set_page_load_timeout(30)
+                selenium_driver.driver.set_script_timeout(30)
+            except WebDriverException:
+                pass
+
+            driver_pool.release(selenium_driver)
+
+    workers = max(1, min(workers, len(links)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker, index == 0) for index in range(workers)]
+
+        for future in futures:
+            future.result()
+
+    progress.close()
+
+    return results
+
+
 class SeleniumMoviesScraper:
     def __init__(self) -> None:
         self.selenium_driver = None
         self.cinema_name = None
         self.url = None
         self.movies = None
+        # Navegadores usados para recorrer las páginas de detalle de cada película
+        self.crawl_workers = 3
+        self.page_load_timeout = 30
+        # Extraer los datos del HTML de la página en lugar de consultar elemento por elemento
+        self.snapshot_mode = True
+        self.html_parser = HtmlParser()
+        # Carga ligera de páginas: cada cine puede cambiarlo si su sitio deja de funcionar
+        self.page_load_strategy = "eager"
+        self.blocked_resources = ["image", "font", "media", "tracker"]
+        self.blocked_url_patterns = []
 
     def set_movies(self, movies):
         self.movies = movies
@@ -124,9 +699,15 @@ class SeleniumMoviesScraper:
     def get_movies(self):
         return self.movies
     
+    def get_driver_options(self) -> dict:
+        return {
+            "page_load_strategy": self.page_load_strategy,
+            "blocked_urls": get_blocked_urls(self.blocked_resources, self.blocked_url_patterns),
+        }
+
     def update_movies(self):
         try:
-            self.selenium_driver = SeleniumDriver()
+            self.selenium_driver = driver_pool.acquire(**self.get_driver_options())
             self.selenium_driver.get(self.url)
             movies = self.get_today_movies()
             self.set_movies(movies)
@@ -136,7 +717,8 @@ class SeleniumMoviesScraper:
             return None
 
         finally:
-            self.selenium_driver.quit()
+            driver_pool.release(self.selenium_driver)
+            self.selenium_driver = None
 
     def get_today_movies(self):
         raw_movies = self.scrape_movies()
@@ -163,7 +745,16 @@ class SeleniumShowtimesScraper:
         self.cinema_name = None
         self.url = None
         self.showtimes = None
-        
+        # Navegadores usados para recorrer las páginas de detalle de cada película
+        self.crawl_workers = 3
+        self.page_load_timeout = 30
+        # Extraer los datos del HTML de la página en lugar de consultar elemento por elemento
+        self.snapshot_mode = True
+        self.html_parser = HtmlParser()
+        # Carga ligera de páginas: cada cine puede cambiarlo si su sitio deja de funcionar
+        self.page_load_strategy = "eager"
+        self.blocked_resources = ["image", "font", "media", "tracker"]
+        self.blocked_url_patterns = []
 
     def set_showtimes(self, showtimes):
         self.showtimes = showtimes
@@ -171,9 +762,15 @@ class SeleniumShowtimesScraper:
     def get_showtimes(self):
         return self.showtimes
 
+    def get_driver_options(self) -> dict:
+        return {
+            "page_load_strategy": self.page_load_strategy,
+            "blocked_urls": get_blocked_urls(self.blocked_resources, self.blocked_url_patterns),
+        }
+
     def update_showtimes(self) -> list[dict] | None:
         try:
-            self.selenium_driver = SeleniumDriver()
+            self.selenium_driver = driver_pool.acquire(**self.get_driver_options())
             self.selenium_driver.get(self.url)
             showtimes = self.get_today_showtimes()
             self.set_showtimes(showtimes)
@@ -183,7 +780,8 @@ class SeleniumShowtimesScraper:
             return None
 
         finally:
-            self.selenium_driver.quit()
+            driver_pool.release(self.selenium_driver)
+            self.selenium_driver = None
 
     def get_today_showtimes(self) -> list[dict] | None:
         raw_showtimes = self.scrape_showtimes()
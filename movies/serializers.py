@@ -1,14 +1,210 @@
 from rest_framework import serializers
+from django.db.models import Q
+from itertools import groupby
 from .models import Movie, CinemaShowtime
 
 
 class MovieSerializer(serializers.ModelSerializer):
+    # content_hash es interno de la ingesta
+    class Meta:
+        model = Movie
+        exclude = ["content_hash"]
+
+
+class IngestListSerializer(serializers.ListSerializer):
+    def load_related(self, data: list) -> None:
+        # Punto de extensión para cargar de una vez lo que las filas referencian
+        pass
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.load_related(data)
+
+        return super().to_internal_value(data)
+
+    def validate_rows(self, data: list) -> tuple[list[dict], list[dict]]:
+        """
+        Valida cada fila por separado: devuelve las filas válidas y, para las
+        inválidas, su posición en `data` y los errores.
+        """
+        self.load_related(data)
+        valid_rows = []
+        errors = []
+
+        for index, item in enumerate(data):
+            try:
+                valid_rows.append(self.run_child_validation(item))
+            except serializers.ValidationError as e:
+                errors.append({"index": index, "errors": e.detail})
+
+        return valid_rows, errors
+
+
+class BillboardMovieSerializer(MovieSerializer):
+    """
+    Película con sus funciones del día agrupadas por cine, sala y formato.
+    Usa las funciones precargadas en `billboard_showtimes` (ver BillboardView).
+    """
+
+    cinemas = serializers.SerializerMethodField()
+
+    def get_cinemas(self, movie: Movie) -> list[dict]:
+        # Las funciones llegan ordenadas por cine, sala, formato y horario
+        showtimes = movie.billboard_showtimes
+
+        return [
+            {
+                "cinema_name": cinema_name,
+                "rooms": [
+                    {
+                        "room": room,
+                        "formats": [
+                            {
+                                "format": format,
+                                "showtimes": [
+                                    {
+                                        "id": showtime.id,
+                                        "schedule": showtime.schedule.strftime("%H:%M"),
+                                        "url": showtime.url,
+                                    }
+                                    for showtime in format_showtimes
+                                ],
+                            }
+                            for format, format_showtimes in groupby(
+                                room_showtimes, key=lambda showtime: showtime.format
+                            )
+                        ],
+                    }
+                    for room, room_showtimes in groupby(
+                        cinema_showtimes, key=lambda showtime: showtime.room
+                    )
+                ],
+            }
+            for cinema_name, cinema_showtimes in groupby(
+                showtimes, key=lambda showtime: showtime.cinema_name
+            )
+        ]
+
+
+class MovieIngestSerializer(serializers.ModelSerializer):
+    # Sin el validador de unicidad: las películas que ya existen se actualizan en lugar de rechazarse
     class Meta:
         model = Movie
         fields = "__all__"
+        validators = []
+        list_serializer_class = IngestListSerializer
 
 
 class CinemaShowtimeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CinemaShowtime
+        exclude = ["content_hash"]
+
+
+class IngestMovieField(serializers.PrimaryKeyRelatedField):
+    # Usa las películas que la lista cargó de una vez en lugar de consultar cada fila
+    def to_internal_value(self, data):
+        movies_by_id = getattr(self.root, "movies_by_id", None)
+
+        if movies_by_id is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        try:
+            movie_id = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        if movie_id not in movies_by_id:
+            self.fail("does_not_exist", pk_value=data)
+
+        return movies_by_id[movie_id]
+
+
+def get_movie_key(data) -> tuple[str, str] | None:
+    # Clave natural (cinema_name, title) de la película de una fila que no trae su id
+    if not isinstance(data, dict) or "movie" in data:
+        return None
+
+    cinema_name, title = data.get("cinema_name"), data.get("title")
+
+    if not isinstance(cinema_name, str) or not isinstance(title, str):
+        return None
+
+    return (cinema_name, title)
+
+
+class CinemaShowtimeIngestListSerializer(IngestListSerializer):
+    """
+    Valida todas las películas referenciadas, por id o por (cinema_name, title),
+    con una sola consulta; el resto de cada fila se valida en memoria.
+    """
+
+    def load_related(self, data: list) -> None:
+        movie_ids = set()
+        movie_keys = set()
+
+        for item in data:
+            movie_key = get_movie_key(item)
+
+            if movie_key is not None:
+                movie_keys.add(movie_key)
+                continue
+
+            try:
+                movie_ids.add(int(item["movie"]))
+            except (KeyError, TypeError, ValueError):
+                # La fila inválida la reporta el campo movie
+                continue
+
+        movies = Movie.objects.only("id", "cinema_name", "title").filter(
+            Q(id__in=movie_ids)
+            | Q(
+                cinema_name__in={cinema_name for cinema_name, _ in movie_keys},
+                title__in={title for _, title in movie_keys},
+            )
+        )
+
+        self.movies_by_id = {movie.id: movie for movie in movies}
+        self.movies_by_key = {
+            (movie.cinema_name, movie.title): movie for movie in self.movies_by_id.values()
+        }
+
+
+class CinemaShowtimeIngestSerializer(serializers.ModelSerializer):
+    """
+    Función a guardar. En lugar del id de la película (movie) la fila puede
+    traer su título exacto (title): se busca por la misma clave única
+    (cinema_name, title) con la que se guardan las películas.
+    """
+
+    movie = IngestMovieField(queryset=Movie.objects.all())
+
+    def to_internal_value(self, data):
+        movie_key = get_movie_key(data)
+
+        if movie_key is not None:
+            movies_by_key = getattr(self.root, "movies_by_key", None)
+
+            if movies_by_key is None:
+                movie = Movie.objects.filter(cinema_name=movie_key[0], title=movie_key[1]).first()
+            else:
+                movie = movies_by_key.get(movie_key)
+
+            if movie is None:
+                raise serializers.ValidationError(
+                    {"title": [f"No existe la película '{movie_key[1]}' en {movie_key[0]}."]}
+                )
+
+            data = {**data, "movie": movie.id}
+
+        return super().to_internal_value(data)
+
+    # Sin el validador de unicidad: las funciones repetidas se resuelven al guardarlas en lote
     class Meta:
         model = CinemaShowtime
         fields = "__all__"
+        validators = []
+        list_serializer_class = CinemaShowtimeIngestListSerializer
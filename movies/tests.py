@@ -1,3 +1,790 @@
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+from selenium.common.exceptions import WebDriverException
+from unittest import mock
+from .cache import bump_data_version
+from .ingestion import ingest_showtimes, save_in_batches, save_movies, save_showtimes
+from .models import Movie, CinemaShowtime, DataVersion
+from .parsers import NDJSONParser
+from .scraping.scraper import SeleniumDriverPool
+from .serializers import CinemaShowtimeIngestSerializer
+import datetime
+import gzip
+import io
+import json
+
+
+class BillboardViewTests(TestCase):
+    date = datetime.date(2024, 6, 1)
+
+    def setUp(self):
+        self.client = APIClient()
+        # Las respuestas en caché de una prueba no deben llegar a la siguiente
+        cache.clear()
+
+    def create_movie(self, title: str, cinema_name: str = "Cinepolis") -> Movie:
+        return Movie.objects.create(
+            title=title, duration="120 min", classification="7+", cinema_name=cinema_name
+        )
+
+    def create_showtime(self, movie: Movie, room: str, format: str, schedule: str, date=None) -> CinemaShowtime:
+        return CinemaShowtime.objects.create(
+            movie=movie,
+            cinema_name=movie.cinema_name,
+            room=room,
+            format=format,
+            date=date or self.date,
+            schedule=schedule,
+            url="https://example.com/funcion",
+        )
+
+    def get_billboard(self, headers: dict | None = None, **params):
+        return self.client.get(
+            reverse("billboard"), {"date": self.date.isoformat(), **params}, headers=headers
+        )
+
+    def test_groups_showtimes_by_cinema_room_and_format(self):
+        movie = self.create_movie("Intensamente 2")
+        self.create_showtime(movie, "Sala 1", "2D", "18:00")
+        self.create_showtime(movie, "Sala 1", "2D", "15:00")
+        self.create_showtime(movie, "Sala 1", "3D", "20:00")
+        self.create_showtime(movie, "Sala 2", "2D", "16:00")
+        # Otro día: no debe aparecer
+        self.create_showtime(movie, "Sala 1", "2D", "21:00", date=self.date + datetime.timedelta(days=1))
+
+        response = self.get_billboard()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+
+        cinemas = response.data[0]["cinemas"]
+        self.assertEqual([cinema["cinema_name"] for cinema in cinemas], ["Cinepolis"])
+
+        rooms = cinemas[0]["rooms"]
+        self.assertEqual([room["room"] for room in rooms], ["Sala 1", "Sala 2"])
+        self.assertEqual([format["format"] for format in rooms[0]["formats"]], ["2D", "3D"])
+        self.assertEqual(
+            [showtime["schedule"] for showtime in rooms[0]["formats"][0]["showtimes"]],
+            ["15:00", "18:00"],
+        )
+
+    def test_filters_by_cinema(self):
+        self.create_showtime(self.create_movie("Garfield", "Cinepolis"), "Sala 1", "2D", "15:00")
+        self.create_showtime(self.create_movie("Garfield", "CineMark"), "Sala 3", "2D", "16:00")
+
+        response = self.get_billboard(cinema_name="CineMark")
+
+        self.assertEqual([movie["cinema_name"] for movie in response.data], ["CineMark"])
+
+    def test_query_count_does_not_grow_with_movies(self):
+        for index in range(10):
+            movie = self.create_movie(f"Película {index}")
+
+            for room in ("Sala 1", "Sala 2"):
+                self.create_showtime(movie, room, "2D", "15:00")
+                self.create_showtime(movie, room, "3D", "19:00")
+
+        # Versión de los datos, películas y funciones del día: tres consultas para cualquier cantidad de películas
+        with self.assertNumQueries(3):
+            response = self.get_billboard()
+
+        self.assertEqual(len(response.data), 10)
+
+    def test_ingest_invalidates_cached_responses(self):
+        movie = {"duration": "120 min", "classification": "7+", "cinema_name": "Cinepolis"}
+        save_movies([{"title": "Garfield", **movie}])
+        self.assertEqual(len(self.client.get(reverse("movies-list")).data["results"]), 1)
+        version = DataVersion.objects.get().version
+
+        # La versión está en la base de datos: la cambia también otro proceso (update_movies --sink db)
+        save_movies([{"title": "Intensamente 2", **movie}])
+
+        self.assertGreater(DataVersion.objects.get().version, version)
+        self.assertEqual(len(self.client.get(reverse("movies-list")).data["results"]), 2)
+
+    def test_default_date_is_part_of_the_cache_key(self):
+        movie = self.create_movie("Garfield")
+        self.create_showtime(movie, "Sala 1", "2D", "15:00")
+        self.create_showtime(movie, "Sala 1", "2D", "18:00", date=self.date + datetime.timedelta(days=1))
+
+        self.assertEqual(self.get_default_schedules(self.date), ["15:00"])
+        # Pasada la medianoche, sin ingestas de por medio, la cartelera por defecto es la del día siguiente
+        self.assertEqual(self.get_default_schedules(self.date + datetime.timedelta(days=1)), ["18:00"])
+
+    def get_default_schedules(self, today: datetime.date) -> list[str]:
+        # Cartelera sin ?date= vista en el día `today`
+        with mock.patch("django.utils.timezone.localdate", return_value=today):
+            response = self.client.get(reverse("billboard"))
+
+        formats = response.data[0]["cinemas"][0]["rooms"][0]["formats"]
+
+        return [showtime["schedule"] for showtime in formats[0]["showtimes"]]
+
+    def test_default_date_is_part_of_the_validators(self):
+        today = timezone.localdate()
+        yesterday = today - datetime.timedelta(days=1)
+        self.create_showtime(self.create_movie("Garfield"), "Sala 1", "2D", "15:00", date=today)
+        DataVersion.objects.update(
+            changed_at=timezone.make_aware(datetime.datetime.combine(yesterday, datetime.time(11)))
+        )
+
+        # Aunque el próximo scraping esté lejos, la cartelera de "hoy" vence a medianoche
+        with mock.patch("django.utils.timezone.localdate", return_value=yesterday), mock.patch(
+            "movies.cache.get_seconds_until_next_scrape", return_value=7 * 24 * 60 * 60
+        ):
+            response = self.client.get(reverse("billboard"))
+
+        max_age = int(response["Cache-Control"].split("max-age=")[1])
+        self.assertLessEqual(max_age, 24 * 60 * 60)
+
+        # Al día siguiente, sin cambios en los datos, ni el ETag ni la fecha de ayer dan 304
+        for headers in (
+            {"If-None-Match": response["ETag"]},
+            {"If-Modified-Since": response["Last-Modified"]},
+        ):
+            modified = self.client.get(reverse("billboard"), headers=headers)
+            self.assertEqual(modified.status_code, 200, headers)
+            self.assertEqual(len(modified.data), 1)
+
+    def test_rejects_invalid_date(self):
+        response = self.client.get(reverse("billboard"), {"date": "mañana"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_answers_not_modified_while_data_does_not_change(self):
+        self.create_showtime(self.create_movie("Garfield"), "Sala 1", "2D", "15:00")
+        # Un cambio de este mismo segundo no lleva Last-Modified (ver add_validators)
+        DataVersion.objects.update(changed_at=timezone.now() - datetime.timedelta(minutes=1))
+        response = self.get_billboard()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("max-age=", response["Cache-Control"])
+
+        # Mismo ETag: 304 con solo la consulta de la versión, sin serializar
+        with self.assertNumQueries(1):
+            not_modified = self.get_billboard(headers={"If-None-Match": response["ETag"]})
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+
+        not_modified = self.get_billboard(headers={"If-Modified-Since": response["Last-Modified"]})
+        self.assertEqual(not_modified.status_code, 304)
+
+        # Una ingesta (desde cualquier proceso) invalida el ETag y la fecha
+        movie = self.create_movie("Intensamente 2")
+        save_showtimes(
+            [
+                {
+                    "movie": movie.id,
+                    "cinema_name": movie.cinema_name,
+                    "room": "Sala 2",
+                    "format": "2D",
+                    "date": self.date.isoformat(),
+                    "schedule": "16:00",
+                    "url": "https://example.com/funcion",
+                }
+            ]
+        )
+
+        modified = self.get_billboard(headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(modified.status_code, 200)
+        self.assertEqual(len(modified.data), 2)
+        self.assertNotEqual(modified["ETag"], response["ETag"])
+
+        modified = self.get_billboard(headers={"If-Modified-Since": response["Last-Modified"]})
+        self.assertEqual(modified.status_code, 200)
+
+    def test_omits_last_modified_in_the_second_of_a_change(self):
+        bump_data_version()
+        changed_at = DataVersion.objects.get().changed_at.timestamp()
+
+        with mock.patch("movies.cache.time.time", return_value=int(changed_at) + 0.5):
+            response = self.get_billboard()
+
+        self.assertIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+
+
+class NDJSONIngestTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def post_gzip(self, body: bytes):
+        return self.client.generic(
+            "POST",
+            reverse("create_movies"),
+            gzip.compress(body),
+            content_type="application/x-ndjson",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    def test_saves_compressed_rows(self):
+        rows = [
+            {"title": title, "duration": "120 min", "classification": "7+", "cinema_name": "Cinepolis"}
+            for title in ("Garfield", "Intensamente 2")
+        ]
+
+        response = self.post_gzip("\n".join(json.dumps(row) for row in rows).encode("utf-8"))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Movie.objects.count(), 2)
+
+    @mock.patch.object(NDJSONParser, "max_line_size", 1024)
+    def test_rejects_line_over_limit(self):
+        # JSON válido, pero más largo que el límite: no debe llegar a decodificarse
+        body = gzip.compress(b'{"title": "' + b"a" * 4096 + b'"}')
+        stream = gzip.GzipFile(fileobj=io.BytesIO(body))
+
+        with self.assertRaises(ParseError):
+            list(NDJSONParser().iter_rows(stream))
+
+    @mock.patch.object(NDJSONParser, "max_body_size", 1024)
+    def test_rejects_body_over_limit(self):
+        stream = io.BytesIO(b"{}\n" * 1024)
+
+        with self.assertRaises(ParseError):
+            list(NDJSONParser().iter_rows(stream))
+
+
+class GroupedShowtimesIngestTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.movie = Movie.objects.create(
+            title="Garfield", duration="120 min", classification="7+", cinema_name="Cinepolis"
+        )
+
+    def create_group(self, rooms) -> dict:
+        return {
+            "movie": self.movie.id,
+            "cinema_name": "Cinepolis",
+            "date": "2024-06-01",
+            "url": "https://example.com/funcion",
+            "rooms": rooms,
+        }
+
+    def post_partial(self, rows: list[dict]):
+        return self.client.post(reverse("create_showtimes") + "?partial=true", rows, format="json")
+
+    def test_reports_errors_at_posted_row_and_group_position(self):
+        response = self.post_partial(
+            [
+                self.create_group({"Sala 1": {"2D": ["15:00", "18:00"]}}),
+                self.create_group({"Sala 2": {"3D": ["16:00", "mañana"]}}),
+            ]
+        )
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data["created"], 3)
+        self.assertEqual(len(response.data["errors"]), 1)
+
+        error = response.data["errors"][0]
+        self.assertEqual(
+            {key: error[key] for key in ("index", "room", "format", "schedule_index")},
+            {"index": 1, "room": "Sala 2", "format": "3D", "schedule_index": 1},
+        )
+
+    def test_groups_can_reference_the_movie_by_title(self):
+        group = self.create_group({"Sala 1": {"2D": ["15:00"]}})
+        del group["movie"]
+
+        response = self.post_partial([{**group, "title": "Garfield"}])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(CinemaShowtime.objects.get().movie, self.movie)
+
+    def test_rejects_the_whole_body_with_one_error_per_posted_row(self):
+        flat_row = {
+            "movie": self.movie.id,
+            "cinema_name": "Cinepolis",
+            "room": "Sala 3",
+            "format": "2D",
+            "date": "2024-06-01",
+            "schedule": "20:00",
+            "url": "https://example.com/funcion",
+        }
+        response = self.client.post(
+            reverse("create_showtimes"),
+            [
+                flat_row,
+                {**flat_row, "schedule": "noche"},
+                self.create_group({"Sala 2": {"3D": ["16:00", "mañana"]}}),
+            ],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(list(response.data[1]), ["schedule"])
+        self.assertEqual(list(response.data[2]["rooms"]["Sala 2"]["3D"]), [1])
+        self.assertFalse(CinemaShowtime.objects.exists())
+
+    def test_malformed_group_is_an_error_on_its_row(self):
+        response = self.post_partial(
+            [
+                self.create_group({"Sala 1": ["15:00"]}),
+                self.create_group({"Sala 2": {"2D": ["16:00"]}}),
+            ]
+        )
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual([error["index"] for error in response.data["errors"]], [0])
+        self.assertIn("rooms", response.data["errors"][0]["errors"])
+
+
+class ShowtimeValidationTests(TestCase):
+    def test_query_count_does_not_grow_with_rows(self):
+        movies = [
+            Movie.objects.create(
+                title=f"Película {i}", duration="120 min", classification="7+", cinema_name="Cinepolis"
+            )
+            for i in range(10)
+        ]
+        rows = [
+            {
+                "movie": movies[i % len(movies)].id,
+                "cinema_name": "Cinepolis",
+                "room": "Sala 1",
+                "format": "2D",
+                "date": "2024-06-01",
+                "schedule": f"{i // 60:02d}:{i % 60:02d}",
+                "url": "https://example.com/funcion",
+            }
+            for i in range(200)
+        ]
+        # La fila con una película que no existe se valida en la misma consulta
+        rows.append({**rows[0], "movie": max(movie.id for movie in movies) + 1})
+
+        serializer = CinemaShowtimeIngestSerializer(data=rows, many=True)
+
+        with self.assertNumQueries(1):
+            self.assertFalse(serializer.is_valid())
+
+        self.assertEqual(sum(1 for error in serializer.errors if error), 1)
+        self.assertIn("movie", serializer.errors[-1])
+
+    def test_resolves_movies_by_exact_title_in_the_same_query(self):
+        movie = Movie.objects.create(
+            title="Garfield", duration="120 min", classification="7+", cinema_name="Cinepolis"
+        )
+        Movie.objects.create(
+            title="Garfield", duration="120 min", classification="7+", cinema_name="CineMark"
+        )
+        row = {
+            "cinema_name": "Cinepolis",
+            "room": "Sala 1",
+            "format": "2D",
+            "date": "2024-06-01",
+            "schedule": "15:00",
+            "url": "https://example.com/funcion",
+        }
+        rows = [
+            {**row, "title": "Garfield"},
+            {**row, "movie": movie.id, "schedule": "18:00"},
+            # La clave es la misma de la restricción única: el título exacto
+            {**row, "title": "garfield"},
+        ]
+
+        serializer = CinemaShowtimeIngestSerializer(data=rows, many=True)
+
+        with self.assertNumQueries(1):
+            valid_rows, errors = serializer.validate_rows(rows)
+
+        self.assertEqual([valid_row["movie"] for valid_row in valid_rows], [movie, movie])
+        self.assertEqual([error["index"] for error in errors], [2])
+        self.assertIn("title", errors[0]["errors"])
+
+
+class UpsertIngestTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.movie = Movie.objects.create(
+            title="Garfield", duration="120 min", classification="7+", cinema_name="Cinepolis"
+        )
+
+    def showtime_row(self, schedule: str, url: str = "https://example.com/funcion") -> dict:
+        return {
+            "movie": self.movie.id,
+            "cinema_name": "Cinepolis",
+            "room": "Sala 1",
+            "format": "2D",
+            "date": "2024-06-01",
+            "schedule": schedule,
+            "url": url,
+        }
+
+    def validated_row(self, schedule: datetime.time) -> dict:
+        # Una fila como la deja el serializer, lista para ingest_showtimes
+        return {
+            **self.showtime_row(schedule.strftime("%H:%M")),
+            "movie": self.movie,
+            "date": datetime.date(2024, 6, 1),
+            "schedule": schedule,
+        }
+
+    def post_showtimes(self, rows: list[dict], query: str = ""):
+        return self.client.post(reverse("create_showtimes") + query, rows, format="json")
+
+    def get_counts(self, response) -> tuple:
+        return tuple(response.data[key] for key in ("created", "updated", "unchanged"))
+
+    def test_reposting_movies_leaves_the_table_unchanged(self):
+        rows = [
+            {"title": title, "duration": "120 min", "classification": "7+", "cinema_name": "CineMark"}
+            for title in ("Garfield", "Intensamente 2")
+        ]
+
+        first = self.client.post(reverse("create_movies"), rows, format="json")
+        stored = list(Movie.objects.order_by("id").values())
+        second = self.client.post(reverse("create_movies"), rows, format="json")
+
+        self.assertEqual(self.get_counts(first), (2, 0, 0))
+        self.assertEqual(self.get_counts(second), (0, 0, 2))
+        self.assertEqual(list(Movie.objects.order_by("id").values()), stored)
+
+    def test_reposting_showtimes_leaves_the_table_unchanged(self):
+        rows = [self.showtime_row("15:00"), self.showtime_row("18:00")]
+
+        first = self.post_showtimes(rows)
+        stored = list(CinemaShowtime.objects.order_by("id").values())
+        second = self.post_showtimes(rows)
+
+        self.assertEqual(self.get_counts(first), (2, 0, 0))
+        self.assertEqual(self.get_counts(second), (0, 0, 2))
+        self.assertEqual(list(CinemaShowtime.objects.order_by("id").values()), stored)
+
+    def test_on_conflict_update_rewrites_only_the_url(self):
+        self.post_showtimes([self.showtime_row("15:00")])
+        stored = CinemaShowtime.objects.values().get()
+        row = self.showtime_row("15:00", url="https://example.com/otra-funcion")
+
+        ignored = self.post_showtimes([row])
+        self.assertEqual(self.get_counts(ignored), (0, 0, 1))
+        self.assertEqual(CinemaShowtime.objects.get().url, stored["url"])
+
+        updated = self.post_showtimes([row], "?on_conflict=update")
+        self.assertEqual(self.get_counts(updated), (0, 1, 0))
+
+        rewritten = CinemaShowtime.objects.values().get()
+        self.assertEqual(rewritten["url"], row["url"])
+        self.assertEqual(
+            {key: value for key, value in rewritten.items() if key not in ("url", "content_hash", "updated_at")},
+            {key: value for key, value in stored.items() if key not in ("url", "content_hash", "updated_at")},
+        )
+
+    def test_rejects_invalid_options(self):
+        for query, field in (
+            ("?on_conflict=replace", "on_conflict"),
+            ("?batch_size=0", "batch_size"),
+            ("?batch_size=mil", "batch_size"),
+        ):
+            response = self.post_showtimes([self.showtime_row("15:00")], query)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertIn(field, response.data)
+
+        self.assertFalse(CinemaShowtime.objects.exists())
+
+    def test_rows_inserted_meanwhile_are_not_counted_as_created(self):
+        bulk_create = CinemaShowtime.objects.bulk_create
+
+        def bulk_create_after_another_request(showtimes, **kwargs):
+            # Otra petición guarda la misma función entre la lectura y el insert
+            CinemaShowtime.objects.create(**self.validated_row(datetime.time(15)))
+            return bulk_create(showtimes, **kwargs)
+
+        with mock.patch.object(
+            CinemaShowtime.objects, "bulk_create", side_effect=bulk_create_after_another_request
+        ):
+            result = ingest_showtimes(
+                [self.validated_row(schedule) for schedule in (datetime.time(15), datetime.time(18))]
+            )
+
+        self.assertEqual((result["created"], result["updated"], result["unchanged"]), (1, 0, 1))
+        self.assertEqual(CinemaShowtime.objects.count(), 2)
+
+
+class SyncIngestTests(TestCase):
+    date = datetime.date(2024, 6, 1)
+
+    def setUp(self):
+        cache.clear()
+
+    def movie_row(self, title: str, cinema_name: str = "Cinepolis", **fields) -> dict:
+        return {
+            "title": title,
+            "duration": "120 min",
+            "classification": "7+",
+            "cinema_name": cinema_name,
+            **fields,
+        }
+
+    def showtime_row(self, movie: Movie, schedule: str, date=None) -> dict:
+        return {
+            "movie": movie.id,
+            "cinema_name": movie.cinema_name,
+            "room": "Sala 1",
+            "format": "2D",
+            "date": (date or self.date).isoformat(),
+            "schedule": schedule,
+            "url": "https://example.com/funcion",
+        }
+
+    def test_unchanged_rows_are_not_rewritten(self):
+        save_movies([self.movie_row("Garfield")])
+        updated_at = Movie.objects.get().updated_at
+
+        result = save_movies([self.movie_row("Garfield")])
+
+        self.assertEqual((result["created"], result["updated"], result["unchanged"]), (0, 0, 1))
+        self.assertEqual(Movie.objects.get().updated_at, updated_at)
+
+        result = save_movies([self.movie_row("Garfield", director="Mark Dindal")])
+
+        self.assertEqual(result["updated"], 1)
+        self.assertEqual(Movie.objects.get().director, "Mark Dindal")
+
+    def test_sync_prunes_only_the_cinemas_sent(self):
+        save_movies(
+            [
+                self.movie_row("Garfield"),
+                self.movie_row("Intensamente 2"),
+                self.movie_row("Garfield", "CineMark"),
+            ]
+        )
+
+        result = save_movies([self.movie_row("Garfield")], sync=True)
+
+        self.assertEqual(result["deleted"], 1)
+        self.assertEqual(
+            sorted(Movie.objects.values_list("cinema_name", "title")),
+            [("CineMark", "Garfield"), ("Cinepolis", "Garfield")],
+        )
+
+    def test_sync_keeps_movies_with_showtimes(self):
+        save_movies([self.movie_row("Garfield"), self.movie_row("Intensamente 2")])
+        movie = Movie.objects.get(title="Intensamente 2")
+        save_showtimes([self.showtime_row(movie, "15:00", self.date - datetime.timedelta(days=7))])
+
+        result = save_movies([self.movie_row("Garfield")], sync=True)
+
+        # Borrarla se llevaría su historial de funciones en cascada
+        self.assertEqual(result["deleted"], 0)
+        self.assertEqual(CinemaShowtime.objects.filter(movie=movie).count(), 1)
+
+    def test_sync_prunes_showtimes_of_the_dates_sent(self):
+        movie = Movie.objects.create(**self.movie_row("Garfield"))
+        next_day = self.date + datetime.timedelta(days=1)
+        save_showtimes(
+            [
+                self.showtime_row(movie, "15:00"),
+                self.showtime_row(movie, "18:00"),
+                self.showtime_row(movie, "15:00", next_day),
+            ]
+        )
+
+        result = save_showtimes([self.showtime_row(movie, "15:00")], sync=True)
+
+        self.assertEqual(result["deleted"], 1)
+        self.assertEqual(
+            sorted(CinemaShowtime.objects.values_list("date", "schedule")),
+            [(self.date, datetime.time(15)), (next_day, datetime.time(15))],
+        )
+
+    def test_invalid_row_skips_pruning_its_scope(self):
+        save_movies([self.movie_row("Garfield"), self.movie_row("Intensamente 2")])
+
+        # Una fila inválida de Cinepolis: no se sabe si Intensamente 2 sigue en cartelera
+        result = save_movies(
+            [self.movie_row("Garfield"), self.movie_row("Intensamente 2", duration="")],
+            partial=True,
+            sync=True,
+        )
+
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertEqual(result["deleted"], 0)
+        self.assertEqual(Movie.objects.count(), 2)
+
+    def test_streamed_batches_do_not_prune_each_other(self):
+        save_movies(
+            [self.movie_row("Garfield"), self.movie_row("Intensamente 2"), self.movie_row("Bad Boys")]
+        )
+
+        result = save_in_batches(
+            [self.movie_row("Garfield"), self.movie_row("Intensamente 2")], save_movies, 1, sync=True
+        )
+
+        self.assertEqual(result["deleted"], 1)
+        self.assertEqual(
+            sorted(Movie.objects.values_list("title", flat=True)), ["Garfield", "Intensamente 2"]
+        )
+
+    def test_scheduled_scraping_syncs(self):
+        client = APIClient()
+
+        with mock.patch("movies.views.call_command") as call_command:
+            client.get(reverse("update_movies"))
+            client.get(reverse("update_showtimes"))
+
+        self.assertEqual(
+            call_command.call_args_list,
+            [
+                mock.call("update_movies", sink="db", sync=True),
+                mock.call("update_showtimes", sink="db", sync=True),
+            ],
+        )
+
+    def test_content_hash_is_not_public(self):
+        save_movies([self.movie_row("Garfield")])
+
+        response = APIClient().get(reverse("movies-list"))
+
+        self.assertNotIn("content_hash", response.data["results"][0])
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+        self.movie = Movie.objects.create(
+            title="Garfield", duration="120 min", classification="7+", cinema_name="Cinepolis"
+        )
+        date = datetime.date(2024, 6, 1)
+        # Horarios repetidos entre días: el id desempata dentro del mismo (date, schedule)
+        CinemaShowtime.objects.bulk_create(
+            CinemaShowtime(
+                movie=self.movie,
+                cinema_name="Cinepolis",
+                room=f"Sala {index}",
+                format="2D",
+                date=date + datetime.timedelta(days=index % 3),
+                schedule=datetime.time(15 + index % 2),
+                url="https://example.com/funcion",
+            )
+            for index in range(25)
+        )
+
+    def test_cursor_walks_every_row_once_in_order(self):
+        url = reverse("cinemashowtime-list") + "?page_size=4"
+        rows = []
+
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data["results"]), 4)
+            rows.extend(response.data["results"])
+            url = response.data["next"]
+
+        keys = [(row["date"], row["schedule"], row["id"]) for row in rows]
+        self.assertEqual(len(keys), 25)
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(len({row["id"] for row in rows}), 25)
+
+    def test_page_size_is_capped(self):
+        Movie.objects.bulk_create(
+            Movie(
+                title=f"Película {index:03}", duration="90 min", classification="7+", cinema_name="CineMark"
+            )
+            for index in range(210)
+        )
+
+        response = self.client.get(reverse("movies-list"), {"page_size": 1000})
+
+        self.assertEqual(len(response.data["results"]), 200)
+        self.assertIsNotNone(response.data["next"])
+
+    def test_rejects_invalid_cursor(self):
+        for cursor in ("no-es-base64", "WzFd", "WyJtYcOxYW5hIiwgIjE1OjAwIiwgMV0="):
+            response = self.client.get(reverse("cinemashowtime-list"), {"cursor": cursor})
+            self.assertEqual(response.status_code, 404, cursor)
+
+
+class ListFilterTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+        self.movie = Movie.objects.create(
+            title="Garfield", duration="120 min", classification="7+", cinema_name="Cinepolis"
+        )
+        for title in ("Gladiador", "Bad Boys"):
+            Movie.objects.create(title=title, duration="120 min", classification="15+", cinema_name="Cinepolis")
+
+        for format in ("2D", "3D"):
+            CinemaShowtime.objects.create(
+                movie=self.movie,
+                cinema_name="Cinepolis",
+                room="Sala 1",
+                format=format,
+                date=datetime.date(2024, 6, 1),
+                schedule=datetime.time(15),
+                url="https://example.com/funcion",
+            )
+
+    def get_showtimes(self, **params):
+        return self.client.get(reverse("cinemashowtime-list"), params)
+
+    def test_rejects_unanchored_filters(self):
+        self.assertEqual(self.get_showtimes(cinema_name="Cinepolis").status_code, 400)
+
+    def test_date_range_needs_both_bounds(self):
+        self.assertEqual(self.get_showtimes(date_from="2024-06-01").status_code, 400)
+        self.assertEqual(
+            self.get_showtimes(date_to="2099-01-01", cinema_name="Cinepolis").status_code, 400
+        )
+
+    def test_date_range_is_limited(self):
+        self.assertEqual(
+            self.get_showtimes(date_from="2024-06-01", date_to="2024-07-01").status_code, 200
+        )
+        self.assertEqual(
+            self.get_showtimes(date_from="2024-06-01", date_to="2024-07-02").status_code, 400
+        )
+
+    def test_movie_format_filters_by_format(self):
+        response = self.get_showtimes(date="2024-06-01", movie_format="3D")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["format"] for row in response.data["results"]], ["3D"])
+
+    def test_filters_movies_by_title_prefix(self):
+        response = self.client.get(reverse("movies-list"), {"cinema_name": "Cinepolis", "title": "G"})
+
+        self.assertEqual([row["title"] for row in response.data["results"]], ["Garfield", "Gladiador"])
+
+
+class SeleniumDriverPoolTests(TestCase):
+    def setUp(self):
+        # Sin Edge: cada navegador "lanzado" es un mock con la estrategia de carga pedida
+        patcher = mock.patch(
+            "movies.scraping.scraper.SeleniumDriver",
+            side_effect=lambda page_load_strategy: mock.Mock(
+                page_load_strategy=page_load_strategy, page_loads=0
+            ),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = SeleniumDriverPool(max_browsers=2, acquire_timeout=0.1)
+
+    def test_never_opens_more_than_max_browsers(self):
+        drivers = [self.pool.acquire(), self.pool.acquire("eager")]
+
+        self.assertIsNone(self.pool.acquire(block=False))
+
+        with self.assertRaises(WebDriverException):
+            self.pool.acquire()
+
+        with mock.patch.object(self.pool, "must_recycle", return_value=False):
+            self.pool.release(drivers[0])
+
+        # El navegador libre tiene otra estrategia: se cierra para lanzar el nuevo
+        evicted_driver = drivers[0]
+        self.pool.acquire("eager")
+
+        evicted_driver.quit.assert_called_once()
+        self.assertEqual(self.pool.open_drivers, 2)
+        self.assertEqual(self.pool.get_stats()["launches"], 3)
 
-# Create your tests here.
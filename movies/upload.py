@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+from movies.ingestion import format_error_location, format_errors, merge_results
+from typing import Callable
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import gzip
+import json
+import requests
+
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def split_chunks(
+    rows: list[dict], chunk_size: int, get_scope: Callable | None = None
+) -> list[list[dict]]:
+    """
+    Divide las filas en bloques de `chunk_size`. Con `get_scope` las filas de un
+    mismo alcance se juntan y nunca quedan repartidas en dos bloques, para que
+    la sincronización de un bloque no borre lo que llega en otro.
+    """
+    if get_scope is None:
+        return [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+
+    scopes = {}
+
+    for row in rows:
+        scopes.setdefault(get_scope(row), []).append(row)
+
+    chunks = []
+    chunk = []
+
+    for scope_rows in scopes.values():
+        if chunk and len(chunk) + len(scope_rows) > chunk_size:
+            chunks.append(chunk)
+            chunk = []
+
+        chunk.extend(scope_rows)
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def encode_chunk(rows: list[dict]) -> bytes:
+    # Una fila JSON por línea (NDJSON) comprimida con gzip
+    lines = "".join(json.dumps(row, default=str) + "\n" for row in rows)
+    return gzip.compress(lines.encode("utf-8"))
+
+
+class ChunkUploader:
+    """
+    Envía filas a un endpoint de ingesta en bloques de NDJSON comprimidos.
+    Cada bloque es una petición independiente: el servidor lo guarda por
+    separado y, como la ingesta es idempotente, un bloque fallido se reintenta
+    solo sin repetir los demás.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        workers: int = 1,
+        retries: int = 3,
+        backoff_factor: float = 1,
+        timeout: tuple[float, float] = (10, 120),
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.workers = max(workers, 1)
+        self.timeout = timeout
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.workers,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(500, 502, 503, 504),
+                # Reenviar un bloque es seguro porque la ingesta no duplica filas
+                allowed_methods=frozenset(["POST"]),
+                raise_on_status=False,
+            ),
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def upload_chunk(self, url: str, rows: list[dict]) -> requests.Response:
+        return self.session.post(
+            url,
+            data=encode_chunk(rows),
+            headers={
+                "Content-Type": NDJSON_CONTENT_TYPE,
+                "Content-Encoding": "gzip",
+            },
+            timeout=self.timeout,
+        )
+
+    def upload(
+        self, url: str, rows: list[dict], get_scope: Callable | None = None
+    ) -> tuple[dict, list[str]]:
+        """
+        Devuelve la suma de los resultados que responde el servidor por bloque y
+        los errores de los bloques o filas que no se pudieron guardar.
+        """
+        chunks = split_chunks(rows, self.chunk_size, get_scope)
+        totals = {}
+        errors = []
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(self.upload_chunk, url, chunk) for chunk in chunks]
+
+            for index, future in enumerate(futures):
+                try:
+                    response = future.result()
+
+                except requests.RequestException as e:
+                    errors.append(f"Bloque {index + 1}/{len(chunks)}: {e}")
+                    continue
+
+                # 207: el bloque se guardó salvo las filas inválidas que se reportan
+                if response.status_code not in (201, 207):
+                    errors.append(
+                        f"Bloque {index + 1}/{len(chunks)}: {response.status_code} {response.text}"
+                    )
+                    continue
+
+                result = response.json()
+                errors.extend(
+                    f"Bloque {index + 1}/{len(chunks)}, {format_error_location(error)}: "
+                    f"{format_errors(error['errors'])}"
+                    for error in result.pop("errors", [])
+                )
+                merge_results(totals, result)
+
+        return totals, errors
+
+    def close(self) -> None:
+        self.session.close()
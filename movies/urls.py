@@ -1,6 +1,6 @@
 from rest_framework import routers
 from .api import MovieViewSet, CinemaShowtimeViewSet
-from .views import UpdateMoviesView, UpdateShowtimesView, CreateMoviesView, CreateShowtimesView
+from .views import UpdateMoviesView, UpdateShowtimesView, CreateMoviesView, CreateShowtimesView, BillboardView
 from django.urls import path
 
 router = routers.DefaultRouter()
@@ -18,4 +18,7 @@ urlpatterns += [
     # Obtener datos de la API
     path('api/create_movies/', CreateMoviesView.as_view(), name='create_movies'),
     path('api/create_showtimes/', CreateShowtimesView.as_view(), name='create_showtimes'),
+
+    # Cartelera de un día: películas con sus funciones
+    path('api/billboard/', BillboardView.as_view(), name='billboard'),
 ]
@@ -4,10 +4,25 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from .models import Movie, CinemaShowtime
-from .serializers import MovieSerializer, CinemaShowtimeSerializer
+from .serializers import MovieSerializer, CinemaShowtimeSerializer, BillboardMovieSerializer
+from .filters import BillboardFilter
+from .cache import get_cached_response
+from django.db.models import Prefetch
+from django.utils import timezone
+from .ingestion import (
+    INGEST_BATCH_SIZE,
+    ON_CONFLICT_CHOICES,
+    save_in_batches,
+    save_movies,
+    save_showtimes,
+)
+from .parsers import NDJSONParser
+from rest_framework.settings import api_settings
+from collections.abc import Iterator
 from rest_framework import status
 from rest_framework.mixins import CreateModelMixin
 from rest_framework.generics import GenericAPIView
+import datetime
 
 
 # Vistas para ejecutar el scraping
@@ -17,7 +32,9 @@ class UpdateMoviesView(APIView):
 
     def get(self, request, *args, **kwargs):
         try:
-            call_command("update_movies")
+            # Esta vista corre junto a la base de datos: guardar sin pasar por la API.
+            # Es el scraping programado, que trae la cartelera completa: sincronizar
+            call_command("update_movies", sink="db", sync=True)
             return Response({"status": "success"}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response(
@@ -29,7 +46,7 @@ class UpdateMoviesView(APIView):
 class UpdateShowtimesView(APIView):
     def get(self, request, *args, **kwargs):
         try:
-            call_command("update_showtimes")
+            call_command("update_showtimes", sink="db", sync=True)
             return Response({"status": "success"}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response(
@@ -39,35 +56,119 @@ class UpdateShowtimesView(APIView):
 
 
 # Vistas para recibir y guardar películas y funciones en la base de datos
+def is_partial(request) -> bool:
+    # ?partial=true guarda las filas válidas y devuelve los errores de las demás
+    return request.query_params.get("partial", "").lower() in ("true", "1")
+
+
+def is_sync(request) -> bool:
+    # ?sync=true borra lo que ya no aparece en el scraping de cada cine (o cine y fecha) enviado
+    return request.query_params.get("sync", "").lower() in ("true", "1")
+
+
+def get_ingest_status(result: dict) -> int:
+    # 207: la petición se guardó solo en parte
+    if result.get("errors"):
+        return status.HTTP_207_MULTI_STATUS
+
+    return status.HTTP_201_CREATED
+
+
 class CreateMoviesView(APIView):
     queryset = Movie.objects.all()
     serializer_class = MovieSerializer
+    parser_classes = api_settings.DEFAULT_PARSER_CLASSES + [NDJSONParser]
 
     def post(self, request, *args, **kwargs):
-        if isinstance(request.data, list):
-            serializer = MovieSerializer(data=request.data, many=True)
+        # Crear o actualizar por (cinema_name, title) en lugar de duplicar la cartelera
+        if isinstance(request.data, Iterator):
+            # Cuerpo NDJSON: guardar por lotes a medida que se lee
+            result = save_in_batches(
+                request.data,
+                save_movies,
+                partial=is_partial(request),
+                sync=is_sync(request),
+            )
         else:
-            serializer = MovieSerializer(data=[request.data], many=True)
-
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            movies = request.data if isinstance(request.data, list) else [request.data]
+            result = save_movies(movies, partial=is_partial(request), sync=is_sync(request))
 
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result, status=get_ingest_status(result))
 
 
 class CreateShowtimesView(APIView):
     queryset = CinemaShowtime.objects.all()
     serializer_class = CinemaShowtimeSerializer
+    parser_classes = api_settings.DEFAULT_PARSER_CLASSES + [NDJSONParser]
 
     def post(self, request, *args, **kwargs):
-        if isinstance(request.data, list):
-            serializer = CinemaShowtimeSerializer(data=request.data, many=True)
+        on_conflict = request.query_params.get("on_conflict", "ignore")
+
+        if on_conflict not in ON_CONFLICT_CHOICES:
+            return Response(
+                {"on_conflict": f"Debe ser uno de {ON_CONFLICT_CHOICES}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            batch_size = int(request.query_params.get("batch_size", INGEST_BATCH_SIZE))
+        except ValueError:
+            batch_size = 0
+
+        if batch_size < 1:
+            return Response(
+                {"batch_size": "Debe ser un entero positivo"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Guardar en lotes: reenviar las funciones del mismo día no las duplica
+        if isinstance(request.data, Iterator):
+            # Los lotes son de filas enviadas (grupos o funciones): así los errores conservan su posición
+            result = save_in_batches(
+                request.data,
+                save_showtimes,
+                batch_size,
+                on_conflict=on_conflict,
+                partial=is_partial(request),
+                sync=is_sync(request),
+            )
         else:
-            serializer = CinemaShowtimeSerializer(data=[request.data], many=True)
+            showtimes = request.data if isinstance(request.data, list) else [request.data]
+            result = save_showtimes(
+                showtimes, batch_size, on_conflict, is_partial(request), is_sync(request)
+            )
+
+        return Response(result, status=get_ingest_status(result))
 
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+# Vista de solo lectura con la cartelera completa de un día
+class BillboardView(APIView):
+    def get(self, request, *args, **kwargs):
+        # Sin ?date= es la cartelera de hoy: cambia a medianoche aunque los datos no cambien
+        default_date = None if "date" in request.query_params else timezone.localdate()
+
+        return get_cached_response(
+            request, lambda: self.build_response(request, default_date), default_date
+        )
+
+    def build_response(self, request, default_date: datetime.date | None = None):
+        billboard_filter = BillboardFilter(data=request.query_params)
+        billboard_filter.is_valid(raise_exception=True)
+
+        showtimes = billboard_filter.get_showtimes(CinemaShowtime.objects.all(), default_date)
+
+        # Dos consultas sin importar cuántas películas haya: películas y sus funciones
+        movies = (
+            Movie.objects.filter(id__in=showtimes.values("movie_id"))
+            .order_by("title", "cinema_name")
+            .prefetch_related(
+                Prefetch(
+                    "cinemashowtime_set",
+                    queryset=showtimes.order_by("cinema_name", "room", "format", "schedule"),
+                    to_attr="billboard_showtimes",
+                )
+            )
+        )
+
+        serializer = BillboardMovieSerializer(movies, many=True)
+        return Response(serializer.data)